@@ -10,12 +10,717 @@ Adapter responsibilities:
 - Concrete implementation of MovieRepository port
 - In-memory data storage and retrieval
 - Full filtering and search capabilities
+- Secondary indexes so selective filters avoid full collection scans
 - Safe concurrent access (thread-safe operations)
 """
 
-from typing import List, Optional, Dict
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
 from movie_domain import Movie
-from movie_repository import MovieRepository
+from movie_repository import MovieRepository, page_slice
+
+
+# adapter.index.trigram.width -> n-gram length used by the title posting lists
+_TRIGRAM_WIDTH: int = 3
+
+# adapter.index.rating.key -> sort key of (rating, movie_id) index entries
+_RATING_KEY = itemgetter(0)
+
+# adapter.cache.query.capacity -> number of distinct filter queries remembered
+_QUERY_CACHE_SIZE: int = 128
+
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    Split text into its distinct overlapping trigrams.
+
+    Args:
+        text: Case-folded string to decompose
+
+    Returns:
+        Set of every 3-character substring of the text (empty for short text)
+
+    Adapter.InMemory.Index.Trigrams -> n-gram decomposition for title postings
+    """
+    # adapter.index.trigram.windows -> slide a fixed-width window over the text
+    return {text[i:i + _TRIGRAM_WIDTH] for i in range(len(text) - _TRIGRAM_WIDTH + 1)}
+
+
+class _CatalogState:
+    """
+    One consistent snapshot of stored movies and their secondary indexes.
+
+    Published snapshots are never modified. Writers work on a successor
+    that shares every container with the published snapshot; a top-level
+    container is shallow-copied the first time a write touches it, and
+    posting sets inside the indexes are copied the same way per key.
+
+    Adapter.InMemory.State -> copy-on-write storage snapshot
+    """
+
+    __slots__ = (
+        "movies", "sequence", "next_sequence", "title_folded", "trigram_index",
+        "year_index", "tag_index", "rating_index", "sorted_years", "rating_sum",
+        "indexed_years", "indexed_ratings", "tags_set", "unique_tags", "version",
+        "query_cache", "last_title_search", "_owned_containers", "_owned_postings"
+    )
+
+    def __init__(self):
+        """
+        Initialize an empty snapshot.
+
+        Adapter.InMemory.State.Construction -> setup empty storage structures
+        """
+        # adapter.storage.primary -> main movie storage keyed by ID
+        self.movies: Dict[str, Movie] = {}
+
+        # adapter.storage.sequence -> insertion order of each ID for ordered index results
+        self.sequence: Dict[str, int] = {}
+        self.next_sequence: int = 0
+
+        # adapter.index.title_folded -> case-folded title cached per movie ID
+        self.title_folded: Dict[str, str] = {}
+
+        # adapter.index.trigram -> title trigram -> IDs of movies containing it
+        self.trigram_index: Dict[str, Set[str]] = {}
+
+        # adapter.index.year -> release year -> IDs of movies from that year
+        self.year_index: Dict[int, Set[str]] = {}
+
+        # adapter.index.tag -> tag -> IDs of movies carrying it
+        self.tag_index: Dict[str, Set[str]] = {}
+
+        # adapter.index.rating -> (rating, movie_id) pairs kept sorted for range scans
+        self.rating_index: List[Tuple[float, str]] = []
+
+        # adapter.aggregate.years -> distinct release years kept sorted for range lookup
+        self.sorted_years: List[int] = []
+
+        # adapter.aggregate.rating_sum -> running total of indexed ratings
+        self.rating_sum: float = 0.0
+
+        # adapter.index.snapshot -> last indexed values, needed to unindex mutated movies
+        # adapter.storage.columns -> also serve as per-attribute columns for filter scans
+        self.indexed_years: Dict[str, int] = {}
+        self.indexed_ratings: Dict[str, Optional[float]] = {}
+
+        # adapter.index.tags_set -> immutable tag set per movie for subset checks
+        self.tags_set: Dict[str, FrozenSet[str]] = {}
+
+        # adapter.aggregate.unique_tags -> distinct tags, built on demand and kept until tags change
+        self.unique_tags: Optional[FrozenSet[str]] = frozenset()
+
+        # adapter.storage.version -> increases with every published snapshot
+        self.version: int = 0
+
+        # adapter.cache.query -> normalized filter tuple -> matching IDs, in LRU order
+        self.query_cache: "OrderedDict[Tuple[Any, ...], Tuple[str, ...]]" = OrderedDict()
+
+        # adapter.cache.title_refinement -> (title, other criteria, IDs) of last title search
+        self.last_title_search: Optional[Tuple[str, Tuple[Any, ...], Tuple[str, ...]]] = None
+
+        # adapter.state.write.owned -> names of containers private to this writer
+        self._owned_containers: Set[str] = set()
+
+        # adapter.state.write.owned -> ids of posting sets private to this writer
+        self._owned_postings: Set[int] = set()
+
+    def copy(self) -> "_CatalogState":
+        """
+        Create a writable successor of this snapshot.
+
+        Containers are shared, not copied: a write privatizes only the
+        containers it changes, so updating one attribute copies the columns
+        and index for that attribute rather than the whole catalog. Adding
+        or removing a movie still touches every per-movie container and
+        costs O(N); bulk loads should go through one save_many call.
+        Derived caches start empty because they describe this snapshot's
+        data, not the successor's.
+
+        Returns:
+            New state sharing entities, containers and posting sets with this one
+
+        Adapter.InMemory.State.Copy -> copy-on-write successor creation
+        """
+        # adapter.state.copy.containers -> shared until the writer first touches them
+        successor = _CatalogState()
+        successor.movies = self.movies
+        successor.sequence = self.sequence
+        successor.next_sequence = self.next_sequence
+        successor.title_folded = self.title_folded
+        successor.trigram_index = self.trigram_index
+        successor.year_index = self.year_index
+        successor.tag_index = self.tag_index
+        successor.rating_index = self.rating_index
+        successor.sorted_years = self.sorted_years
+        successor.rating_sum = self.rating_sum
+        successor.indexed_years = self.indexed_years
+        successor.indexed_ratings = self.indexed_ratings
+        successor.tags_set = self.tags_set
+        successor.unique_tags = self.unique_tags
+
+        # adapter.storage.version.bump -> successor invalidates derived results
+        successor.version = self.version + 1
+        return successor
+
+    def seal(self) -> None:
+        """
+        Finish writing so the snapshot can be published.
+
+        Adapter.InMemory.State.Seal -> drop writer bookkeeping before publication
+        """
+        # adapter.state.write.release -> later writers must copy before touching containers
+        self._owned_containers.clear()
+        self._owned_postings.clear()
+
+    def _writable(self, name: str) -> Any:
+        """
+        Get a top-level container this writer may modify in place.
+
+        Args:
+            name: Attribute name of the container
+
+        Returns:
+            Container private to this writer
+
+        Adapter.InMemory.State.Privatize -> copy shared containers on first touch
+        """
+        # adapter.state.write.ownership -> shared containers are copied once per write
+        container = getattr(self, name)
+        if name not in self._owned_containers:
+            container = container.copy()
+            setattr(self, name, container)
+            self._owned_containers.add(name)
+        return container
+
+    def _add_posting(self, index: str, key: Hashable, movie_id: str) -> None:
+        """
+        Register a movie ID under an index key.
+
+        Args:
+            index: Attribute name of the posting index
+            key: Index key (trigram, year, or tag)
+            movie_id: Identifier to register
+
+        Adapter.InMemory.Index.Posting_Add -> copy-on-write inverted index insertion
+        """
+        # adapter.index.posting.insert -> create or privatize posting, then add
+        self._writable_posting(index, key).add(movie_id)
+
+    def _discard_posting(self, index: str, key: Hashable, movie_id: str) -> None:
+        """
+        Remove a movie ID from an index key, pruning empty postings.
+
+        Args:
+            index: Attribute name of the posting index
+            key: Index key (trigram, year, or tag)
+            movie_id: Identifier to remove
+
+        Adapter.InMemory.Index.Posting_Remove -> copy-on-write inverted index removal
+        """
+        # adapter.index.posting.remove -> drop ID and forget keys nobody uses
+        if key in getattr(self, index):
+            postings = self._writable_posting(index, key)
+            postings.discard(movie_id)
+            if not postings:
+                del self._writable(index)[key]
+
+    def _writable_posting(self, index: str, key: Hashable) -> Set[str]:
+        """
+        Get a posting set this writer may modify in place.
+
+        Args:
+            index: Attribute name of the posting index
+            key: Index key whose posting is needed
+
+        Returns:
+            Posting set private to this writer (created if missing)
+
+        Adapter.InMemory.Index.Posting_Privatize -> copy shared postings on first touch
+        """
+        # adapter.index.posting.ownership -> shared sets are copied once per write
+        postings = getattr(self, index).get(key)
+        if postings is None or id(postings) not in self._owned_postings:
+            postings = set(postings) if postings is not None else set()
+            self._writable(index)[key] = postings
+            self._owned_postings.add(id(postings))
+        return postings
+
+    def store(self, movie: Movie, rating_batch: Optional[List[Tuple[float, str]]] = None) -> None:
+        """
+        Store a movie and bring its index entries up to date.
+
+        Args:
+            movie: Movie entity to persist in storage
+            rating_batch: Pending rating entries to merge later, or None to insert immediately
+
+        Adapter.InMemory.Storage.Store -> primary storage write with index upkeep
+        """
+        # adapter.storage.persistence -> store movie by unique identifier
+        # adapter.storage.persistence.same_entity -> re-saving the stored instance leaves storage shared
+        if self.movies.get(movie.id) is not movie:
+            self._writable("movies")[movie.id] = movie
+
+        # adapter.storage.sequence.assign -> first save fixes the movie's position
+        if movie.id not in self.sequence:
+            self._writable("sequence")[movie.id] = self.next_sequence
+            self.next_sequence += 1
+
+        # adapter.index.refresh -> bring secondary indexes in line with the entity
+        self._index_movie(movie, rating_batch)
+
+    def merge_ratings(self, rating_batch: List[Tuple[float, str]]) -> None:
+        """
+        Merge pending rating entries into the sorted rating index.
+
+        Args:
+            rating_batch: Rating entries collected by batched stores
+
+        Adapter.InMemory.Index.Rating_Merge -> single sort for batched inserts
+        """
+        # adapter.index.rating.merge -> single sort restores rating order
+        if rating_batch:
+            rating_index = self._writable("rating_index")
+            rating_index.extend(rating_batch)
+            rating_index.sort()
+
+    def remove(self, movie_id: str) -> bool:
+        """
+        Remove a movie and all of its index entries.
+
+        Args:
+            movie_id: Identifier of the movie to remove
+
+        Returns:
+            True if the movie was stored, False otherwise
+
+        Adapter.InMemory.Storage.Remove -> primary storage removal with index upkeep
+        """
+        # adapter.storage.removal.existence_check -> nothing to do for unknown IDs
+        if movie_id not in self.movies:
+            return False
+
+        # adapter.storage.removal.delete_operation -> remove from storage
+        del self._writable("movies")[movie_id]
+
+        # adapter.index.cleanup -> drop secondary index entries for removed movie
+        self._unindex_movie(movie_id)
+        return True
+
+    def _index_movie(self, movie: Movie, rating_batch: Optional[List[Tuple[float, str]]] = None) -> None:
+        """
+        Update every secondary index for a saved movie.
+
+        Only attributes that differ from the last indexed snapshot are
+        touched, so re-saving an unchanged movie is cheap.
+
+        Args:
+            movie: Movie entity whose current state should be indexed
+            rating_batch: Pending rating entries to merge later, or None to insert immediately
+
+        Adapter.InMemory.Index.Refresh -> incremental secondary index maintenance
+        """
+        movie_id = movie.id
+
+        # adapter.index.title.refresh -> re-index only when the title changed
+        title_folded = movie.title.casefold()
+        previous_title = self.title_folded.get(movie_id)
+        if previous_title != title_folded:
+            if previous_title is not None:
+                self._unindex_title(movie_id, previous_title)
+            self._index_title(movie_id, title_folded)
+
+        # adapter.index.year.refresh -> move ID between year postings when changed
+        previous_year = self.indexed_years.get(movie_id)
+        if previous_year != movie.year:
+            if previous_year is not None:
+                self._unindex_year(movie_id, previous_year)
+            self._index_year(movie_id, movie.year)
+            self._writable("indexed_years")[movie_id] = movie.year
+
+        # adapter.index.rating.refresh -> reposition ID in the sorted rating index
+        if movie_id not in self.indexed_ratings or self.indexed_ratings[movie_id] != movie.rating:
+            self._unindex_rating(movie_id)
+            if movie.rating is not None:
+                if rating_batch is None:
+                    insort(self._writable("rating_index"), (movie.rating, movie_id))
+                else:
+                    rating_batch.append((movie.rating, movie_id))
+                self.rating_sum += movie.rating
+            self._writable("indexed_ratings")[movie_id] = movie.rating
+
+        # adapter.index.tags.refresh -> re-register tag postings when tags changed
+        tags = frozenset(movie.tag_tuple)
+        previous_tags = self.tags_set.get(movie_id)
+        if previous_tags != tags:
+            for tag in (previous_tags or frozenset()) - tags:
+                self._unindex_tag(movie_id, tag)
+            for tag in tags - (previous_tags or frozenset()):
+                self._index_tag(movie_id, tag)
+            self._writable("tags_set")[movie_id] = tags
+
+    def _unindex_movie(self, movie_id: str) -> None:
+        """
+        Remove a movie ID from every secondary index.
+
+        Args:
+            movie_id: Identifier of the movie being removed
+
+        Adapter.InMemory.Index.Remove -> purge all secondary index entries
+        """
+        # adapter.index.title.cleanup -> drop title index entries
+        self._unindex_title(movie_id, self.title_folded[movie_id])
+
+        # adapter.index.year.cleanup -> drop year posting
+        self._unindex_year(movie_id, self._writable("indexed_years").pop(movie_id))
+
+        # adapter.index.rating.cleanup -> drop sorted rating entry
+        self._unindex_rating(movie_id)
+        del self._writable("indexed_ratings")[movie_id]
+
+        # adapter.index.tags.cleanup -> drop tag postings
+        for tag in self._writable("tags_set").pop(movie_id):
+            self._unindex_tag(movie_id, tag)
+
+        # adapter.storage.sequence.cleanup -> forget insertion position
+        del self._writable("sequence")[movie_id]
+
+    def _index_title(self, movie_id: str, title_folded: str) -> None:
+        """
+        Add a movie's case-folded title to the title indexes.
+
+        Args:
+            movie_id: Identifier of the movie being indexed
+            title_folded: Case-folded title to index
+
+        Adapter.InMemory.Index.Title_Add -> populate title cache and trigram postings
+        """
+        # adapter.index.title.cache -> remember case-folded form for verification
+        self._writable("title_folded")[movie_id] = title_folded
+
+        # adapter.index.trigram.postings -> register movie under each trigram
+        for trigram in _trigrams(title_folded):
+            self._add_posting("trigram_index", trigram, movie_id)
+
+    def _unindex_title(self, movie_id: str, title_folded: str) -> None:
+        """
+        Remove a movie's case-folded title from the title indexes.
+
+        Args:
+            movie_id: Identifier of the movie being unindexed
+            title_folded: Case-folded title that was previously indexed
+
+        Adapter.InMemory.Index.Title_Remove -> purge title cache and trigram postings
+        """
+        # adapter.index.title.cache -> forget cached case-folded form
+        self._writable("title_folded").pop(movie_id, None)
+
+        # adapter.index.trigram.postings -> drop movie from each trigram, pruning empties
+        for trigram in _trigrams(title_folded):
+            self._discard_posting("trigram_index", trigram, movie_id)
+
+    def _unindex_rating(self, movie_id: str) -> None:
+        """
+        Remove a movie's entry from the sorted rating index, if present.
+
+        Args:
+            movie_id: Identifier whose previously indexed rating should be removed
+
+        Adapter.InMemory.Index.Rating_Remove -> binary-search removal from sorted index
+        """
+        # adapter.index.rating.lookup -> previous rating locates the entry in O(log N)
+        previous_rating = self.indexed_ratings.get(movie_id)
+        if previous_rating is not None:
+            entry = (previous_rating, movie_id)
+            position = bisect_left(self.rating_index, entry)
+            if position < len(self.rating_index) and self.rating_index[position] == entry:
+                del self._writable("rating_index")[position]
+                self.rating_sum -= previous_rating
+
+    def _index_year(self, movie_id: str, year: int) -> None:
+        """
+        Register a movie under its release year.
+
+        Args:
+            movie_id: Identifier of the movie being indexed
+            year: Release year to index
+
+        Adapter.InMemory.Index.Year_Add -> year posting and sorted year maintenance
+        """
+        # adapter.aggregate.years.insert -> first movie of a year extends the sorted years
+        if year not in self.year_index:
+            insort(self._writable("sorted_years"), year)
+        self._add_posting("year_index", year, movie_id)
+
+    def _unindex_year(self, movie_id: str, year: int) -> None:
+        """
+        Remove a movie from its previously indexed release year.
+
+        Args:
+            movie_id: Identifier of the movie being unindexed
+            year: Release year that was previously indexed
+
+        Adapter.InMemory.Index.Year_Remove -> year posting and sorted year maintenance
+        """
+        # adapter.index.year.posting -> drop ID from the year's posting
+        self._discard_posting("year_index", year, movie_id)
+
+        # adapter.aggregate.years.remove -> last movie of a year shrinks the sorted years
+        if year not in self.year_index:
+            del self._writable("sorted_years")[bisect_left(self.sorted_years, year)]
+
+    def _index_tag(self, movie_id: str, tag: str) -> None:
+        """
+        Register a movie under one of its tags.
+
+        Args:
+            movie_id: Identifier of the movie being indexed
+            tag: Tag to index
+
+        Adapter.InMemory.Index.Tag_Add -> tag posting and distinct tag maintenance
+        """
+        # adapter.aggregate.unique_tags.stale -> a brand-new tag changes the distinct set
+        if tag not in self.tag_index:
+            self.unique_tags = None
+        self._add_posting("tag_index", tag, movie_id)
+
+    def _unindex_tag(self, movie_id: str, tag: str) -> None:
+        """
+        Remove a movie from one of its previously indexed tags.
+
+        Args:
+            movie_id: Identifier of the movie being unindexed
+            tag: Tag that was previously indexed
+
+        Adapter.InMemory.Index.Tag_Remove -> tag posting and distinct tag maintenance
+        """
+        # adapter.index.tag.posting -> drop ID from the tag's posting
+        self._discard_posting("tag_index", tag, movie_id)
+
+        # adapter.aggregate.unique_tags.stale -> last use of a tag changes the distinct set
+        if tag not in self.tag_index:
+            self.unique_tags = None
+
+    def distinct_tags(self) -> FrozenSet[str]:
+        """
+        Get every tag in use, building the set at most once per tag change.
+
+        Returns:
+            Immutable set of distinct tags
+
+        Adapter.InMemory.Aggregate.Distinct_Tags -> cached distinct tag set
+        """
+        # adapter.aggregate.unique_tags.build -> idempotent, safe if readers race here
+        unique_tags = self.unique_tags
+        if unique_tags is None:
+            unique_tags = self.unique_tags = frozenset(self.tag_index)
+        return unique_tags
+
+    def refine_title_search(
+        self,
+        title_folded: Optional[str],
+        other_criteria: Tuple[Any, ...]
+    ) -> Optional[Tuple[str, ...]]:
+        """
+        Narrow the previous title search when the new title extends it.
+
+        Any title containing the new query also contains every substring of
+        it, so when the last search on this snapshot used a substring of the
+        new title (with identical other criteria), its results are a superset
+        of the new answer and only need re-checking.
+
+        Args:
+            title_folded: Case-folded title query, if any
+            other_criteria: Normalized non-title criteria of the query
+
+        Returns:
+            Matching movie IDs in storage order, or None if no reusable search exists
+
+        Adapter.InMemory.Filter.Title_Refinement -> incremental title narrowing
+        """
+        # adapter.cache.title_refinement.applicable -> same criteria, longer title
+        last_search = self.last_title_search
+        if title_folded is None or last_search is None:
+            return None
+        last_title, last_criteria, last_ids = last_search
+        if last_criteria != other_criteria or last_title not in title_folded:
+            return None
+
+        # adapter.filter.title_refinement -> re-check only the previous matches
+        title_index = self.title_folded
+        return tuple(movie_id for movie_id in last_ids if title_folded in title_index[movie_id])
+
+    def match_filters(
+        self,
+        title_folded: Optional[str],
+        year: Optional[int],
+        rating_min: Optional[float],
+        rating_max: Optional[float],
+        tags: Optional[List[str]]
+    ) -> Tuple[str, ...]:
+        """
+        Compute the IDs of movies satisfying every active filter criterion.
+
+        Args:
+            title_folded: Case-folded title query, if any
+            year: Exact year criterion, if any
+            rating_min: Minimum rating criterion, if any
+            rating_max: Maximum rating criterion, if any
+            tags: Required tags, if any
+
+        Returns:
+            Matching movie IDs in storage order
+
+        Adapter.InMemory.Filter.Match -> uncached filter evaluation
+        """
+        # adapter.filter.empty.short_circuit -> no criteria means every movie, no predicate pass
+        if title_folded is None and year is None and rating_min is None and rating_max is None and not tags:
+            return tuple(self.movies)
+
+        # adapter.filter.exact_index -> year-only or tags-only queries are answered by postings alone
+        if title_folded is None and rating_min is None and rating_max is None and (year is None or not tags):
+            if year is not None:
+                postings: Set[str] = self.year_index.get(year, set())
+            else:
+                tag_postings = sorted(
+                    (self.tag_index.get(tag, set()) for tag in set(tags)), key=len
+                )
+                postings = tag_postings[0].intersection(*tag_postings[1:])
+            return tuple(sorted(postings, key=self.sequence.__getitem__))
+
+        # adapter.filter.materialize -> drain the lazy evaluation into a cacheable tuple
+        return tuple(self.iter_matches(title_folded, year, rating_min, rating_max, tags))
+
+    def iter_matches(
+        self,
+        title_folded: Optional[str],
+        year: Optional[int],
+        rating_min: Optional[float],
+        rating_max: Optional[float],
+        tags: Optional[List[str]]
+    ) -> Iterator[str]:
+        """
+        Lazily yield the IDs of movies satisfying every active filter criterion.
+
+        Args:
+            title_folded: Case-folded title query, if any
+            year: Exact year criterion, if any
+            rating_min: Minimum rating criterion, if any
+            rating_max: Maximum rating criterion, if any
+            tags: Required tags, if any
+
+        Returns:
+            Iterator over matching movie IDs in storage order
+
+        Adapter.InMemory.Filter.Iter_Matches -> incremental filter evaluation
+        """
+        # adapter.filter.tags.requirement -> build required set once per query
+        required_tags = frozenset(tags) if tags else None
+
+        # adapter.filter.rating.presence -> either bound excludes unrated movies
+        rating_bounded = rating_min is not None or rating_max is not None
+
+        # adapter.storage.columns -> predicates read indexed attribute columns, not entities
+        years = self.indexed_years
+        ratings = self.indexed_ratings
+        title_index = self.title_folded
+        tags_set = self.tags_set
+
+        # adapter.filter.single_pass -> each candidate visited once, rejected at first miss
+        # adapter.filter.ordering -> year equality, rating compares, tag subset, then substring search
+        return (
+            movie_id
+            for movie_id in self._select_candidates(title_folded, year, rating_min, rating_max, tags)
+            if (year is None or years[movie_id] == year)
+            and (not rating_bounded or ratings[movie_id] is not None)
+            and (rating_min is None or ratings[movie_id] >= rating_min)
+            and (rating_max is None or ratings[movie_id] <= rating_max)
+            and (required_tags is None or required_tags <= tags_set[movie_id])
+            and (title_folded is None or title_folded in title_index[movie_id])
+        )
+
+    def _select_candidates(
+        self,
+        title_folded: Optional[str],
+        year: Optional[int],
+        rating_min: Optional[float],
+        rating_max: Optional[float],
+        tags: Optional[List[str]]
+    ) -> List[str]:
+        """
+        Choose the smallest index-backed candidate set for a filter query.
+
+        Each active criterion with an index yields an estimated candidate
+        count (posting size, or rating range width via two binary searches).
+        The cheapest source is materialized; criteria without an index-backed
+        estimate fall back to every stored ID.
+
+        Args:
+            title_folded: Case-folded title query, if any
+            year: Exact year criterion, if any
+            rating_min: Minimum rating criterion, if any
+            rating_max: Maximum rating criterion, if any
+            tags: Required tags, if any
+
+        Returns:
+            Candidate movie IDs in storage order (superset of the final result)
+
+        Adapter.InMemory.Index.Plan -> selectivity-based candidate selection
+        """
+        # adapter.index.plan.sources -> (estimated size, producer) for each usable index
+        sources: List[Tuple[int, Any]] = []
+
+        if year is not None:
+            year_postings = self.year_index.get(year, set())
+            sources.append((len(year_postings), lambda: year_postings))
+
+        if tags:
+            # adapter.index.tag.selectivity -> intersect postings smallest first
+            tag_postings = sorted((self.tag_index.get(tag, set()) for tag in set(tags)), key=len)
+            sources.append((
+                len(tag_postings[0]),
+                lambda: tag_postings[0].intersection(*tag_postings[1:])
+            ))
+
+        if rating_min is not None or rating_max is not None:
+            # adapter.index.rating.range -> two binary searches bound the slice
+            low = 0 if rating_min is None else bisect_left(
+                self.rating_index, rating_min, key=_RATING_KEY
+            )
+            high = len(self.rating_index) if rating_max is None else bisect_right(
+                self.rating_index, rating_max, key=_RATING_KEY
+            )
+            high = max(low, high)
+            sources.append((
+                high - low,
+                lambda: {movie_id for _, movie_id in self.rating_index[low:high]}
+            ))
+
+        if title_folded is not None:
+            title_postings = [
+                self.trigram_index.get(trigram, set()) for trigram in _trigrams(title_folded)
+            ]
+            if title_postings:
+                title_postings.sort(key=len)
+                sources.append((
+                    len(title_postings[0]),
+                    lambda: title_postings[0].intersection(*title_postings[1:])
+                ))
+
+        # adapter.index.plan.full_scan -> nothing indexable, consider every movie
+        if not sources:
+            return list(self.movies)
+
+        # adapter.index.plan.cheapest -> materialize only the most selective source
+        _, produce = min(sources, key=itemgetter(0))
+        candidate_ids = produce()
+
+        # adapter.index.plan.ordering -> preserve insertion order of results
+        return sorted(candidate_ids, key=self.sequence.__getitem__)
 
 
 class InMemoryMovieRepository(MovieRepository):
@@ -27,6 +732,15 @@ class InMemoryMovieRepository(MovieRepository):
     referential integrity and supports all filtering operations
     defined in the port interface.
 
+    Secondary indexes over title trigrams, year, rating, and tags are kept
+    in step with every save and delete. Filter queries start from the most
+    selective index and only verify the remaining criteria on that subset.
+
+    Concurrency uses copy-on-write snapshots: writers serialize on a lock,
+    build a successor snapshot, and publish it with a single reference
+    assignment. Readers take the current snapshot without locking and
+    always see a consistent catalog.
+
     Adapter.InMemory.MovieRepository -> concrete storage implementation
     """
 
@@ -36,8 +750,14 @@ class InMemoryMovieRepository(MovieRepository):
 
         Adapter.InMemory.Construction -> setup empty storage structures
         """
-        # adapter.storage.primary -> main movie storage keyed by ID
-        self._movies: Dict[str, Movie] = {}
+        # adapter.storage.snapshot -> currently published catalog state
+        self._state: _CatalogState = _CatalogState()
+
+        # adapter.concurrency.write_lock -> serializes snapshot successors
+        self._write_lock = threading.Lock()
+
+        # adapter.concurrency.cache_lock -> guards per-snapshot query caches
+        self._cache_lock = threading.Lock()
 
     def save(self, movie: Movie) -> None:
         """
@@ -46,13 +766,71 @@ class InMemoryMovieRepository(MovieRepository):
         This operation will overwrite any existing movie with the same ID,
         effectively implementing both insert and update semantics.
 
+        Updating a stored movie copies only the containers for the
+        attributes that changed. Inserting a new movie copies every
+        per-movie container, which costs O(N); store many movies with one
+        save_many call instead of a save per movie.
+
         Args:
             movie: Movie entity to persist in storage
 
         Adapter.InMemory.Operation.Save -> store entity in memory structures
         """
-        # adapter.storage.persistence -> store movie by unique identifier
-        self._movies[movie.id] = movie
+        with self._write_lock:
+            # adapter.storage.snapshot.successor -> write against a private copy
+            state = self._state.copy()
+
+            # adapter.storage.persistence -> store and index the single entity
+            state.store(movie)
+
+            # adapter.storage.snapshot.publish -> readers switch atomically
+            self._publish(state)
+
+    def save_many(self, movies: Iterable[Movie]) -> None:
+        """
+        Store several movie entities in one batch.
+
+        The whole batch is applied to a single successor snapshot: new
+        rating index entries are merged with one sort and readers switch
+        to the result (and drop cached queries) once.
+
+        Args:
+            movies: Movie entities to persist in storage
+
+        Adapter.InMemory.Operation.Save_Many -> batched storage and index update
+        """
+        # adapter.storage.batch.dedupe -> last entity per ID wins, first position kept
+        batch = {movie.id: movie for movie in movies}
+
+        with self._write_lock:
+            # adapter.storage.snapshot.successor -> one copy for the whole batch
+            state = self._state.copy()
+
+            # adapter.index.rating.batch -> collect rating entries for one merge
+            rating_batch: List[Tuple[float, str]] = []
+
+            # adapter.storage.persistence.batch -> store and index each entity
+            for movie in batch.values():
+                state.store(movie, rating_batch)
+            state.merge_ratings(rating_batch)
+
+            # adapter.storage.snapshot.publish -> readers switch atomically
+            self._publish(state)
+
+    def _publish(self, state: _CatalogState) -> None:
+        """
+        Make a finished successor snapshot visible to readers.
+
+        Args:
+            state: Successor snapshot built under the write lock
+
+        Adapter.InMemory.Snapshot.Publish -> atomic reference swap
+        """
+        # adapter.storage.snapshot.seal -> no further in-place changes
+        state.seal()
+
+        # adapter.storage.snapshot.swap -> single assignment is atomic for readers
+        self._state = state
 
     def find_by_id(self, movie_id: str) -> Optional[Movie]:
         """
@@ -67,19 +845,65 @@ class InMemoryMovieRepository(MovieRepository):
         Adapter.InMemory.Operation.Find_By_Id -> lookup entity by identity
         """
         # adapter.storage.retrieval.by_key -> direct dictionary lookup
-        return self._movies.get(movie_id)
+        return self._state.movies.get(movie_id)
 
-    def find_all(self) -> List[Movie]:
+    def find_by_ids(self, movie_ids: Iterable[str]) -> Dict[str, Movie]:
         """
-        Retrieve all movies from storage.
+        Retrieve several movies by identifier from one snapshot.
+
+        Args:
+            movie_ids: Unique identifiers of the movies to retrieve
 
         Returns:
-            List containing all stored movie entities
+            Dictionary mapping each found identifier to its movie (unknown IDs omitted)
+
+        Adapter.InMemory.Operation.Find_By_Ids -> batch lookup by identity
+        """
+        # adapter.storage.retrieval.by_keys -> consistent lookups against a single snapshot
+        movies = self._state.movies
+        return {movie_id: movies[movie_id] for movie_id in movie_ids if movie_id in movies}
+
+    def find_all(self, limit: Optional[int] = None, offset: int = 0) -> List[Movie]:
+        """
+        Retrieve all movies from storage, optionally one page at a time.
+
+        Args:
+            limit: Maximum number of movies to return (None for all)
+            offset: Number of movies to skip, in insertion order
+
+        Returns:
+            List containing all stored movie entities (or the requested page)
+
+        Raises:
+            InvalidFilterError: If limit or offset is negative
 
         Adapter.InMemory.Operation.Find_All -> complete collection access
         """
+        # adapter.filter.pagination.window -> validate page bounds
+        page = page_slice(limit, offset)
+        movies = self._state.movies
+
         # adapter.storage.retrieval.complete -> return all stored values
-        return list(self._movies.values())
+        if limit is None and not offset:
+            return list(movies.values())
+
+        # adapter.storage.retrieval.page -> copy only the requested window
+        return list(islice(movies.values(), page.start, page.stop))
+
+    def iter_all(self) -> Iterator[Movie]:
+        """
+        Iterate over all movies without copying the collection.
+
+        Published snapshots are never modified, so the iterator stays valid
+        and consistent even if movies are saved or deleted meanwhile.
+
+        Returns:
+            Iterator over the movies of the current snapshot
+
+        Adapter.InMemory.Operation.Iter_All -> streaming collection access
+        """
+        # adapter.storage.retrieval.stream -> iterate the immutable snapshot directly
+        return iter(self._state.movies.values())
 
     def find_by_filters(
         self,
@@ -87,7 +911,9 @@ class InMemoryMovieRepository(MovieRepository):
         year: Optional[int] = None,
         rating_min: Optional[float] = None,
         rating_max: Optional[float] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Movie]:
         """
         Retrieve movies matching the specified filter criteria.
@@ -96,82 +922,168 @@ class InMemoryMovieRepository(MovieRepository):
         all specified criteria to the movie collection. Movies must
         match ALL provided criteria to be included in results.
 
+        The candidate set comes from the most selective secondary index
+        for the active criteria; the remaining predicates are then only
+        evaluated against those candidates. Results of recent queries are
+        cached by their normalized criteria until the next save or delete.
+
         Args:
             title: Partial title to search for (case-insensitive substring match)
             year: Specific release year to match exactly
             rating_min: Minimum rating threshold (inclusive, ignores unrated movies)
             rating_max: Maximum rating threshold (inclusive, ignores unrated movies)
             tags: List of tags that must ALL be present on matching movies
+            limit: Maximum number of movies to return (None for all)
+            offset: Number of matching movies to skip, in insertion order
 
         Returns:
             List of movie entities satisfying all specified filter criteria
 
+        Raises:
+            InvalidFilterError: If limit or offset is negative
+
         Adapter.InMemory.Operation.Find_By_Filters -> filtered search implementation
         """
-        # adapter.storage.retrieval.all_candidates -> start with complete collection
-        candidates: List[Movie] = list(self._movies.values())
+        # adapter.filter.pagination.window -> validate page before doing any work
+        page = page_slice(limit, offset)
 
-        # adapter.filter.title_matching -> case-insensitive substring search
-        if title is not None:
-            title_lower = title.lower()  # adapter.filter.case_insensitive -> normalize case
-            candidates = [
-                movie for movie in candidates
-                if title_lower in movie.title.lower()
-            ]
+        # adapter.storage.snapshot.read -> one consistent snapshot for the whole query
+        state = self._state
+        matching_ids = self._matching_ids(state, title, year, rating_min, rating_max, tags)
 
-        # adapter.filter.year_matching -> exact year comparison
-        if year is not None:
-            candidates = [
-                movie for movie in candidates
-                if movie.year == year
-            ]
+        # adapter.storage.retrieval.filtered -> materialize entities for the requested page only
+        movies = state.movies
+        return [movies[movie_id] for movie_id in matching_ids[page]]
 
-        # adapter.filter.rating_range -> numeric threshold filtering
-        if rating_min is not None:
-            # adapter.filter.rating_minimum -> include only movies at or above threshold
-            candidates = [
-                movie for movie in candidates
-                if movie.rating is not None and movie.rating >= rating_min
-            ]
+    def _matching_ids(
+        self,
+        state: _CatalogState,
+        title: Optional[str],
+        year: Optional[int],
+        rating_min: Optional[float],
+        rating_max: Optional[float],
+        tags: Optional[List[str]]
+    ) -> Tuple[str, ...]:
+        """
+        Resolve the complete, cached tuple of matching IDs for a query.
 
-        if rating_max is not None:
-            # adapter.filter.rating_maximum -> include only movies at or below threshold
-            candidates = [
-                movie for movie in candidates
-                if movie.rating is not None and movie.rating <= rating_max
-            ]
+        Args:
+            state: Snapshot the query runs against
+            title: Partial title to search for, if any
+            year: Exact year criterion, if any
+            rating_min: Minimum rating criterion, if any
+            rating_max: Maximum rating criterion, if any
+            tags: Required tags, if any
 
-        # adapter.filter.tags_matching -> require all specified tags present
-        if tags is not None and len(tags) > 0:
-            candidates = [
-                movie for movie in candidates
-                if self._movie_has_all_tags(movie, tags)
-            ]
+        Returns:
+            Matching movie IDs in storage order
+
+        Adapter.InMemory.Filter.Resolve -> cache, refinement, or full evaluation
+        """
+        # adapter.filter.case_insensitive -> case-fold title query once for Unicode-aware matching
+        title_folded = title.casefold() if title is not None else None
+
+        # adapter.cache.query.key -> tag order does not affect the result
+        cache_key = (title_folded, year, rating_min, rating_max, tuple(sorted(set(tags or ()))))
+
+        # adapter.cache.query.lookup -> repeated query shapes skip filtering entirely
+        with self._cache_lock:
+            matching_ids = state.query_cache.get(cache_key)
+            if matching_ids is not None:
+                state.query_cache.move_to_end(cache_key)
+            else:
+                matching_ids = state.refine_title_search(title_folded, cache_key[1:])
+
+        if matching_ids is None:
+            matching_ids = state.match_filters(title_folded, year, rating_min, rating_max, tags)
 
-        # adapter.storage.retrieval.filtered -> return matching subset
-        return candidates
+        with self._cache_lock:
+            # adapter.cache.title_refinement.store -> remember title search for narrowing
+            if title_folded is not None:
+                state.last_title_search = (title_folded, cache_key[1:], matching_ids)
+            # adapter.cache.query.store -> remember result, evicting least recently used
+            state.query_cache[cache_key] = matching_ids
+            state.query_cache.move_to_end(cache_key)
+            if len(state.query_cache) > _QUERY_CACHE_SIZE:
+                state.query_cache.popitem(last=False)
 
-    def _movie_has_all_tags(self, movie: Movie, required_tags: List[str]) -> bool:
+        return matching_ids
+
+    def count_by_filters(
+        self,
+        title: Optional[str] = None,
+        year: Optional[int] = None,
+        rating_min: Optional[float] = None,
+        rating_max: Optional[float] = None,
+        tags: Optional[List[str]] = None
+    ) -> int:
         """
-        Check if a movie contains all required tags.
+        Count movies matching the specified filter criteria.
+
+        Shares the query cache with find_by_filters but never materializes
+        movie entities.
 
         Args:
-            movie: Movie entity to check for tag presence
-            required_tags: List of tags that must all be present
+            title: Partial title to search for (case-insensitive substring match)
+            year: Specific release year to match exactly
+            rating_min: Minimum rating threshold (inclusive, ignores unrated movies)
+            rating_max: Maximum rating threshold (inclusive, ignores unrated movies)
+            tags: List of tags that must ALL be present on matching movies
 
         Returns:
-            True if movie contains all required tags, False otherwise
+            Number of movies satisfying all specified criteria
 
-        Adapter.InMemory.Filter.Tags_Validation -> tag presence verification
+        Adapter.InMemory.Operation.Count_By_Filters -> filtered count without entities
         """
-        # adapter.filter.tags.movie_collection -> get movie's tag collection
-        movie_tags_set = set(movie.tags)
+        # adapter.filter.count -> length of the cached ID tuple
+        return len(self._matching_ids(self._state, title, year, rating_min, rating_max, tags))
 
-        # adapter.filter.tags.requirement_check -> verify all required tags present
-        required_tags_set = set(required_tags)
+    def iter_by_filters(
+        self,
+        title: Optional[str] = None,
+        year: Optional[int] = None,
+        rating_min: Optional[float] = None,
+        rating_max: Optional[float] = None,
+        tags: Optional[List[str]] = None
+    ) -> Iterator[Movie]:
+        """
+        Lazily iterate over movies matching the specified filter criteria.
 
-        # adapter.logic.set_inclusion -> check if required tags are subset of movie tags
-        return required_tags_set.issubset(movie_tags_set)
+        A cached result for the same criteria is replayed directly.
+        Otherwise the filters are evaluated incrementally against the
+        current snapshot, so a consumer that stops early never pays for
+        the remaining candidates. Partial evaluations are not cached.
+
+        Args:
+            title: Partial title to search for (case-insensitive substring match)
+            year: Specific release year to match exactly
+            rating_min: Minimum rating threshold (inclusive, ignores unrated movies)
+            rating_max: Maximum rating threshold (inclusive, ignores unrated movies)
+            tags: List of tags that must ALL be present on matching movies
+
+        Returns:
+            Iterator over matching movie entities in insertion order
+
+        Adapter.InMemory.Operation.Iter_By_Filters -> streaming filtered search
+        """
+        # adapter.storage.snapshot.read -> one consistent snapshot for the whole iteration
+        state = self._state
+
+        # adapter.filter.case_insensitive -> case-fold title query once
+        title_folded = title.casefold() if title is not None else None
+
+        # adapter.cache.query.lookup -> replay a completed evaluation when available
+        cache_key = (title_folded, year, rating_min, rating_max, tuple(sorted(set(tags or ()))))
+        with self._cache_lock:
+            matching_ids: Optional[Iterable[str]] = state.query_cache.get(cache_key)
+
+        # adapter.filter.lazy -> evaluate on demand otherwise
+        if matching_ids is None:
+            matching_ids = state.iter_matches(title_folded, year, rating_min, rating_max, tags)
+
+        # adapter.storage.retrieval.stream -> materialize entities one at a time
+        movies = state.movies
+        return (movies[movie_id] for movie_id in matching_ids)
 
     def delete(self, movie_id: str) -> bool:
         """
@@ -185,15 +1097,87 @@ class InMemoryMovieRepository(MovieRepository):
 
         Adapter.InMemory.Operation.Delete -> remove entity from storage
         """
-        # adapter.storage.removal.existence_check -> verify movie exists before deletion
-        if movie_id in self._movies:
-            # adapter.storage.removal.delete_operation -> remove from storage
-            del self._movies[movie_id]
+        with self._write_lock:
+            # adapter.storage.removal.existence_check -> verify movie exists before copying
+            if movie_id not in self._state.movies:
+                # adapter.operation.delete.not_found -> indicate entity was not present
+                return False
+
+            # adapter.storage.snapshot.successor -> write against a private copy
+            state = self._state.copy()
+
+            # adapter.storage.removal.delete_operation -> remove entity and index entries
+            state.remove(movie_id)
+
+            # adapter.storage.snapshot.publish -> readers switch atomically
+            self._publish(state)
+
             # adapter.operation.delete.success -> confirm successful removal
             return True
-        else:
-            # adapter.operation.delete.not_found -> indicate entity was not present
-            return False
+
+    def delete_many(self, movie_ids: Iterable[str]) -> int:
+        """
+        Remove several movies from storage in one batch.
+
+        All removals are applied to a single successor snapshot, so readers
+        switch over (and drop cached queries) once for the whole batch.
+
+        Args:
+            movie_ids: Unique identifiers of the movies to remove
+
+        Returns:
+            Number of movies that were found and deleted
+
+        Adapter.InMemory.Operation.Delete_Many -> batched removal and index update
+        """
+        with self._write_lock:
+            # adapter.storage.removal.existence_check -> skip unknown and repeated IDs
+            movies = self._state.movies
+            present = [movie_id for movie_id in dict.fromkeys(movie_ids) if movie_id in movies]
+            if not present:
+                return 0
+
+            # adapter.storage.snapshot.successor -> one copy for the whole batch
+            state = self._state.copy()
+
+            # adapter.storage.removal.batch -> remove entities and index entries
+            for movie_id in present:
+                state.remove(movie_id)
+
+            # adapter.storage.snapshot.publish -> readers switch atomically
+            self._publish(state)
+
+            # adapter.operation.delete_many.result -> number of removed entities
+            return len(present)
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Report aggregate figures from incrementally maintained state.
+
+        Every figure is read from the secondary indexes and running totals,
+        so the cost does not grow with the number of stored movies. The
+        distinct tag set is rebuilt only after a tag is first used or
+        last removed.
+
+        Returns:
+            Dictionary of raw aggregate figures as defined by the port
+
+        Adapter.InMemory.Operation.Statistics -> index-backed aggregate figures
+        """
+        # adapter.storage.snapshot.read -> all figures from the same snapshot
+        state = self._state
+
+        # adapter.aggregate.years.bounds -> first and last of the sorted distinct years
+        year_range = (state.sorted_years[0], state.sorted_years[-1]) if state.sorted_years else None
+
+        # adapter.aggregate.result -> figures straight from maintained state
+        return {
+            "total_movies": len(state.movies),
+            "movies_with_ratings": len(state.rating_index),
+            "rating_sum": state.rating_sum,
+            "unique_tags": state.distinct_tags(),
+            "year_range": year_range
+        }
 
     def count(self) -> int:
         """
@@ -205,4 +1189,16 @@ class InMemoryMovieRepository(MovieRepository):
         Adapter.InMemory.Operation.Count -> collection size calculation
         """
         # adapter.storage.aggregation.count -> return size of storage collection
-        return len(self._movies)
\ No newline at end of file
+        return len(self._state.movies)
+
+    def version(self) -> int:
+        """
+        Get the version of the currently published snapshot.
+
+        Returns:
+            Snapshot version, increased by every save or delete
+
+        Adapter.InMemory.Operation.Version -> snapshot change token
+        """
+        # adapter.storage.version.read -> every publication bumps the snapshot version
+        return self._state.version
@@ -16,7 +16,8 @@ CLI adapter responsibilities:
 
 import sys
 import argparse
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from movie_domain import Movie, InvalidRatingError, InvalidTitleError, InvalidYearError
 from movie_repository import MovieRepository, InvalidFilterError
 from movie_command_service import MovieCommandService
@@ -24,6 +25,38 @@ from movie_query_service import MovieQueryService
 from in_memory_repository import InMemoryMovieRepository
 
 
+@lru_cache(maxsize=1024, typed=True)
+def _format_summary(
+    title: str,
+    year: int,
+    rating: Optional[float],
+    tags: Tuple[str, ...],
+    movie_id: str,
+    description: str
+) -> str:
+    """
+    Format a movie summary block from its displayed attributes.
+
+    The cache key is the full set of displayed values, so re-listing
+    unchanged movies reuses the formatted text and any change to a movie
+    naturally produces a new entry. Keys are typed, so an int rating and
+    an equal float rating (rendered differently) never share an entry.
+
+    Returns:
+        Three-line summary block without a trailing newline
+
+    CLI.Output.Summary_Format -> memoized movie summary rendering
+    """
+    rating_str = f"{rating}/10" if rating else "Unrated"
+    tags_str = f" [{', '.join(tags)}]" if tags else ""
+
+    return (
+        f"  • {title} ({year}) - {rating_str}{tags_str}\n"
+        f"    ID: {movie_id}\n"
+        f"    {description}"
+    )
+
+
 class MovieCLI:
     """
     Command-line interface adapter for movie catalog operations.
@@ -48,8 +81,13 @@ class MovieCLI:
         self._repository: MovieRepository = repository
 
         # cli.services.application_layer -> create coordinated application services
-        self._command_service: MovieCommandService = MovieCommandService(repository)
         self._query_service: MovieQueryService = MovieQueryService(repository)
+        self._command_service: MovieCommandService = MovieCommandService(
+            repository, query_service=self._query_service
+        )
+
+        # cli.argument.parser -> build parser once, reused by every run() call
+        self._parser: argparse.ArgumentParser = self._create_argument_parser()
 
     def run(self, args: Optional[List[str]] = None) -> None:
         """
@@ -60,29 +98,54 @@ class MovieCLI:
 
         CLI.Execution.Main -> primary entry point for command processing
         """
-        # cli.argument.parsing -> setup argument parser with subcommands
-        parser = self._create_argument_parser()
-
         # cli.argument.resolution -> parse provided or system arguments
         if args is None:
             args = sys.argv[1:]
 
+        # cli.execution.exit_status -> terminate with failure status on errors
+        status = self._execute(args)
+        if status:
+            sys.exit(status)
+
+    def _execute(self, args: List[str]) -> int:
+        """
+        Parse and dispatch one command without exiting the process.
+
+        Args:
+            args: List of command-line arguments for a single command
+
+        Returns:
+            Exit status: 0 on success, 1 for command errors, 2 for usage errors
+
+        CLI.Execution.Dispatch -> command processing with status reporting
+        """
+        # cli.argument.parsing -> reuse parser built at construction
+        parser = self._parser
+
         # cli.execution.parse_and_dispatch -> parse arguments and execute command
         try:
             parsed_args = parser.parse_args(args)
             # cli.dispatch.command -> route to appropriate command handler
             parsed_args.func(parsed_args)
+        except argparse.ArgumentError as e:
+            # cli.error.usage -> report malformed command without raising SystemExit
+            parser.print_usage(sys.stderr)
+            self._print_error(str(e))
+            return 2
         except AttributeError:
             # cli.error.no_command -> handle case where no subcommand provided
             parser.print_help()
         except (InvalidRatingError, InvalidTitleError, InvalidYearError, InvalidFilterError) as e:
             # cli.error.domain_validation -> handle domain validation errors
             self._print_error(f"Validation error: {e}")
-            sys.exit(1)
+            return 1
         except Exception as e:
             # cli.error.unexpected -> handle unexpected system errors
             self._print_error(f"Unexpected error: {e}")
-            sys.exit(1)
+            return 1
+
+        # cli.execution.success -> command completed normally
+        return 0
 
     def _create_argument_parser(self) -> argparse.ArgumentParser:
         """
@@ -94,9 +157,11 @@ class MovieCLI:
         CLI.Configuration.Parser -> setup command-line interface structure
         """
         # cli.parser.main -> primary argument parser configuration
+        # cli.parser.errors -> raise ArgumentError instead of exiting the process
         parser = argparse.ArgumentParser(
             description="Movie Catalog - Personal movie collection manager",
-            formatter_class=argparse.RawDescriptionHelpFormatter
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            exit_on_error=False
         )
 
         # cli.parser.subcommands -> create subcommand system
@@ -134,7 +199,7 @@ class MovieCLI:
 
     def _add_add_command(self, subparsers) -> None:
         """Add movie addition subcommand configuration."""
-        add_parser = subparsers.add_parser("add", help="Add a new movie to the catalog")
+        add_parser = subparsers.add_parser("add", help="Add a new movie to the catalog", exit_on_error=False)
         add_parser.add_argument("title", help="Movie title")
         add_parser.add_argument("year", type=int, help="Release year")
         add_parser.add_argument("description", help="Movie description or synopsis")
@@ -144,7 +209,7 @@ class MovieCLI:
 
     def _add_list_command(self, subparsers) -> None:
         """Add movie listing subcommand configuration."""
-        list_parser = subparsers.add_parser("list", help="List movies in the catalog")
+        list_parser = subparsers.add_parser("list", help="List movies in the catalog", exit_on_error=False)
         list_parser.add_argument("--year", type=int, help="Filter by release year")
         list_parser.add_argument("--min-rating", type=float, help="Minimum rating filter")
         list_parser.add_argument("--max-rating", type=float, help="Maximum rating filter")
@@ -153,43 +218,43 @@ class MovieCLI:
 
     def _add_search_command(self, subparsers) -> None:
         """Add movie search subcommand configuration."""
-        search_parser = subparsers.add_parser("search", help="Search movies by title")
+        search_parser = subparsers.add_parser("search", help="Search movies by title", exit_on_error=False)
         search_parser.add_argument("title", help="Title search term")
         search_parser.set_defaults(func=self._handle_search_command)
 
     def _add_rate_command(self, subparsers) -> None:
         """Add movie rating subcommand configuration."""
-        rate_parser = subparsers.add_parser("rate", help="Rate a movie")
+        rate_parser = subparsers.add_parser("rate", help="Rate a movie", exit_on_error=False)
         rate_parser.add_argument("movie_id", help="Movie ID to rate")
         rate_parser.add_argument("rating", type=float, help="Rating (1.0-10.0)")
         rate_parser.set_defaults(func=self._handle_rate_command)
 
     def _add_tag_commands(self, subparsers) -> None:
         """Add movie tagging subcommand configurations."""
-        tag_parser = subparsers.add_parser("tag", help="Add tag to a movie")
+        tag_parser = subparsers.add_parser("tag", help="Add tag to a movie", exit_on_error=False)
         tag_parser.add_argument("movie_id", help="Movie ID to tag")
         tag_parser.add_argument("tag", help="Tag to add")
         tag_parser.set_defaults(func=self._handle_add_tag_command)
 
-        untag_parser = subparsers.add_parser("untag", help="Remove tag from a movie")
+        untag_parser = subparsers.add_parser("untag", help="Remove tag from a movie", exit_on_error=False)
         untag_parser.add_argument("movie_id", help="Movie ID to untag")
         untag_parser.add_argument("tag", help="Tag to remove")
         untag_parser.set_defaults(func=self._handle_remove_tag_command)
 
     def _add_delete_command(self, subparsers) -> None:
         """Add movie deletion subcommand configuration."""
-        delete_parser = subparsers.add_parser("delete", help="Delete a movie from catalog")
+        delete_parser = subparsers.add_parser("delete", help="Delete a movie from catalog", exit_on_error=False)
         delete_parser.add_argument("movie_id", help="Movie ID to delete")
         delete_parser.set_defaults(func=self._handle_delete_command)
 
     def _add_stats_command(self, subparsers) -> None:
         """Add catalog statistics subcommand configuration."""
-        stats_parser = subparsers.add_parser("stats", help="Show catalog statistics")
+        stats_parser = subparsers.add_parser("stats", help="Show catalog statistics", exit_on_error=False)
         stats_parser.set_defaults(func=self._handle_stats_command)
 
     def _add_test_command(self, subparsers) -> None:
         """Add test harness subcommand configuration."""
-        test_parser = subparsers.add_parser("test", help="Run tests with interactive pause")
+        test_parser = subparsers.add_parser("test", help="Run tests with interactive pause", exit_on_error=False)
         test_parser.set_defaults(func=self._handle_test_command)
 
     def _handle_add_command(self, args) -> None:
@@ -205,8 +270,8 @@ class MovieCLI:
         print(f"  ID: {movie.id}")
         if movie.rating:
             print(f"  Rating: {movie.rating}/10")
-        if movie.tags:
-            print(f"  Tags: {', '.join(movie.tags)}")
+        if movie.tag_tuple:
+            print(f"  Tags: {', '.join(movie.tag_tuple)}")
 
     def _handle_list_command(self, args) -> None:
         """Handle movie listing command."""
@@ -221,9 +286,8 @@ class MovieCLI:
             print("No movies found matching the criteria.")
             return
 
-        print(f"Found {len(movies)} movie(s):")
-        for movie in movies:
-            self._print_movie_summary(movie)
+        # cli.output.buffered -> assemble the whole listing, then write it once
+        self._write_movie_listing(f"Found {len(movies)} movie(s):", movies)
 
     def _handle_search_command(self, args) -> None:
         """Handle movie search command."""
@@ -233,36 +297,35 @@ class MovieCLI:
             print(f"No movies found matching title: {args.title}")
             return
 
-        print(f"Found {len(movies)} movie(s) matching '{args.title}':")
-        for movie in movies:
-            self._print_movie_summary(movie)
+        # cli.output.buffered -> assemble the whole listing, then write it once
+        self._write_movie_listing(f"Found {len(movies)} movie(s) matching '{args.title}':", movies)
 
     def _handle_rate_command(self, args) -> None:
         """Handle movie rating command."""
-        success = self._command_service.rate_movie(args.movie_id, args.rating)
+        # cli.operation.updated_entity -> command returns the movie, no re-lookup needed
+        movie = self._command_service.rate_movie(args.movie_id, args.rating)
 
-        if success:
-            movie = self._query_service.get_movie_by_id(args.movie_id)
+        if movie:
             print(f"✓ Rated '{movie.title}': {args.rating}/10")
         else:
             print(f"✗ Movie with ID '{args.movie_id}' not found")
 
     def _handle_add_tag_command(self, args) -> None:
         """Handle add tag command."""
-        success = self._command_service.add_tag_to_movie(args.movie_id, args.tag)
+        # cli.operation.updated_entity -> command returns the movie, no re-lookup needed
+        movie = self._command_service.add_tag_to_movie(args.movie_id, args.tag)
 
-        if success:
-            movie = self._query_service.get_movie_by_id(args.movie_id)
+        if movie:
             print(f"✓ Added tag '{args.tag}' to '{movie.title}'")
         else:
             print(f"✗ Movie with ID '{args.movie_id}' not found")
 
     def _handle_remove_tag_command(self, args) -> None:
         """Handle remove tag command."""
-        success = self._command_service.remove_tag_from_movie(args.movie_id, args.tag)
+        # cli.operation.updated_entity -> command returns the movie, no re-lookup needed
+        movie = self._command_service.remove_tag_from_movie(args.movie_id, args.tag)
 
-        if success:
-            movie = self._query_service.get_movie_by_id(args.movie_id)
+        if movie:
             print(f"✓ Removed tag '{args.tag}' from '{movie.title}'")
         else:
             print(f"✗ Movie with ID '{args.movie_id}' not found")
@@ -337,9 +400,9 @@ class MovieCLI:
                 elif user_input:
                     # cli.test.command_execution -> execute user command in test context
                     try:
-                        self.run(user_input.split())
+                        self._execute(user_input.split())
                     except SystemExit:
-                        # cli.test.error_recovery -> continue after command errors
+                        # cli.test.error_recovery -> argparse still exits for help and missing arguments
                         continue
                 print()
         except KeyboardInterrupt:
@@ -357,17 +420,24 @@ class MovieCLI:
             ("Unrated Movie", 2023, "A movie without a rating yet", None, ["mystery"])
         ]
 
-        for title, year, desc, rating, tags in sample_movies:
-            self._command_service.add_movie(title, year, desc, rating, tags)
-
-    def _print_movie_summary(self, movie: Movie) -> None:
-        """Print formatted movie summary."""
-        rating_str = f"{movie.rating}/10" if movie.rating else "Unrated"
-        tags_str = f" [{', '.join(movie.tags)}]" if movie.tags else ""
-
-        print(f"  • {movie.title} ({movie.year}) - {rating_str}{tags_str}")
-        print(f"    ID: {movie.id}")
-        print(f"    {movie.description}")
+        # cli.test.sample_data.batch -> validate every entity, then store in one batch
+        self._command_service.add_movies([
+            {"title": title, "year": year, "description": desc, "rating": rating, "tags": tags}
+            for title, year, desc, rating, tags in sample_movies
+        ])
+
+    def _write_movie_listing(self, header: str, movies: List[Movie]) -> None:
+        """Write a header and movie summaries to stdout in a single call."""
+        lines = [header]
+        lines.extend(self._format_movie_summary(movie) for movie in movies)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+
+    def _format_movie_summary(self, movie: Movie) -> str:
+        """Format movie summary as a three-line block."""
+        return _format_summary(
+            movie.title, movie.year, movie.rating, movie.tag_tuple, movie.id, movie.description
+        )
 
     def _print_error(self, message: str) -> None:
         """Print error message to stderr."""
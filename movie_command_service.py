@@ -13,10 +13,13 @@ Application layer responsibilities:
 - Handle application-specific logic and workflows
 """
 
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 from movie_domain import Movie
 from movie_repository import MovieRepository
 
+if TYPE_CHECKING:
+    from movie_query_service import MovieQueryService
+
 
 class MovieCommandService:
     """
@@ -30,18 +33,27 @@ class MovieCommandService:
     Application.Service.Command -> state modification operations coordinator
     """
 
-    def __init__(self, repository: MovieRepository):
+    def __init__(
+        self,
+        repository: MovieRepository,
+        query_service: Optional["MovieQueryService"] = None
+    ):
         """
         Initialize command service with repository dependency.
 
         Args:
             repository: MovieRepository implementation for persistence operations
+            query_service: Optional query service whose request memo is
+                invalidated after every save or delete
 
         Application.Service.Construction -> dependency injection for storage abstraction
         """
         # application.service.dependency.repository -> injected storage abstraction
         self._repository: MovieRepository = repository
 
+        # application.service.dependency.query_service -> read side to keep consistent
+        self._query_service: Optional["MovieQueryService"] = query_service
+
     def add_movie(
         self,
         title: str,
@@ -86,11 +98,45 @@ class MovieCommandService:
 
         # application.operation.persistence -> save entity through repository abstraction
         self._repository.save(movie)
+        self._invalidate([movie.id])
 
         # application.service.result.created_entity -> return persisted entity
         return movie
 
-    def rate_movie(self, movie_id: str, rating: float) -> bool:
+    def add_movies(self, items: List[Dict[str, Any]]) -> List[Movie]:
+        """
+        Create and persist several new movie entities in one batch.
+
+        Every entity is constructed and validated before anything is
+        stored, so an invalid item leaves the catalog untouched. The valid
+        batch is then handed to the repository in a single save_many call.
+
+        Args:
+            items: Movie attribute dictionaries accepted by add_movie
+                (title, year, description, and optional rating and tags)
+
+        Returns:
+            The created and persisted Movie entities, in input order
+
+        Raises:
+            InvalidTitleError: If any title is empty or invalid
+            InvalidYearError: If any year is outside reasonable bounds
+            InvalidRatingError: If any rating is outside valid range
+            Repository exceptions: If persistence fails
+
+        Application.Service.Command.Add_Movies -> create and persist movie batch
+        """
+        # application.operation.entity_creation.batch -> validate whole batch up front
+        movies = [Movie(**item) for item in items]
+
+        # application.operation.persistence.batch -> one repository call for the batch
+        self._repository.save_many(movies)
+        self._invalidate(movie.id for movie in movies)
+
+        # application.service.result.created_entities -> return persisted entities
+        return movies
+
+    def rate_movie(self, movie_id: str, rating: float) -> Optional[Movie]:
         """
         Update the rating of an existing movie.
 
@@ -103,7 +149,7 @@ class MovieCommandService:
             rating: Numeric rating between 1.0 and 10.0
 
         Returns:
-            True if movie was found and rating updated successfully, False if movie not found
+            The updated Movie entity, or None if movie not found
 
         Raises:
             InvalidRatingError: If rating is outside valid range
@@ -117,18 +163,23 @@ class MovieCommandService:
         # application.logic.existence_check -> verify movie exists before modification
         if movie is None:
             # application.service.result.not_found -> indicate target not found
-            return False
+            return None
+
+        # application.logic.noop_check -> unchanged rating needs no validation or save
+        if movie.rating == rating:
+            return movie
 
         # application.operation.domain_update -> delegate rating logic to domain entity
         movie.rate(rating)
 
         # application.operation.persistence -> save modified entity
         self._repository.save(movie)
+        self._invalidate([movie.id])
 
-        # application.service.result.success -> indicate successful operation
-        return True
+        # application.service.result.updated_entity -> return modified entity to caller
+        return movie
 
-    def add_tag_to_movie(self, movie_id: str, tag: str) -> bool:
+    def add_tag_to_movie(self, movie_id: str, tag: str) -> Optional[Movie]:
         """
         Add a categorization tag to an existing movie.
 
@@ -141,7 +192,7 @@ class MovieCommandService:
             tag: Categorization string to add to the movie
 
         Returns:
-            True if movie was found and tag added successfully, False if movie not found
+            The updated Movie entity, or None if movie not found
 
         Raises:
             Repository exceptions: If retrieval or persistence fails
@@ -154,18 +205,24 @@ class MovieCommandService:
         # application.logic.existence_check -> verify movie exists before modification
         if movie is None:
             # application.service.result.not_found -> indicate target not found
-            return False
+            return None
 
         # application.operation.domain_update -> delegate tag logic to domain entity
+        original_tags = movie.tag_tuple
         movie.add_tag(tag)
 
+        # application.logic.noop_check -> skip persistence when tags did not change
+        if movie.tag_tuple is original_tags:
+            return movie
+
         # application.operation.persistence -> save modified entity
         self._repository.save(movie)
+        self._invalidate([movie.id])
 
-        # application.service.result.success -> indicate successful operation
-        return True
+        # application.service.result.updated_entity -> return modified entity to caller
+        return movie
 
-    def remove_tag_from_movie(self, movie_id: str, tag: str) -> bool:
+    def remove_tag_from_movie(self, movie_id: str, tag: str) -> Optional[Movie]:
         """
         Remove a categorization tag from an existing movie.
 
@@ -178,7 +235,7 @@ class MovieCommandService:
             tag: Categorization string to remove from the movie
 
         Returns:
-            True if movie was found and tag removal attempted, False if movie not found
+            The updated Movie entity, or None if movie not found
 
         Raises:
             Repository exceptions: If retrieval or persistence fails
@@ -191,16 +248,96 @@ class MovieCommandService:
         # application.logic.existence_check -> verify movie exists before modification
         if movie is None:
             # application.service.result.not_found -> indicate target not found
-            return False
+            return None
 
         # application.operation.domain_update -> delegate tag removal logic to domain entity
+        original_tags = movie.tag_tuple
         movie.remove_tag(tag)
 
+        # application.logic.noop_check -> skip persistence when tags did not change
+        if movie.tag_tuple is original_tags:
+            return movie
+
         # application.operation.persistence -> save modified entity
         self._repository.save(movie)
+        self._invalidate([movie.id])
+
+        # application.service.result.updated_entity -> return modified entity to caller
+        return movie
 
-        # application.service.result.success -> indicate successful operation
-        return True
+    def add_tags_to_movies(self, updates: List[Tuple[str, str]]) -> Dict[str, Movie]:
+        """
+        Add tags to several existing movies in one batch.
+
+        Args:
+            updates: (movie_id, tag) pairs to apply
+
+        Returns:
+            Dictionary mapping each found movie ID to its updated entity
+            (IDs that were not found are omitted)
+
+        Raises:
+            Repository exceptions: If retrieval or persistence fails
+
+        Application.Service.Command.Add_Tags -> batch categorization of existing movies
+        """
+        # application.operation.batch_tagging -> delegate tag logic to domain entities
+        return self._apply_tag_updates(updates, Movie.add_tag)
+
+    def remove_tags_from_movies(self, updates: List[Tuple[str, str]]) -> Dict[str, Movie]:
+        """
+        Remove tags from several existing movies in one batch.
+
+        Args:
+            updates: (movie_id, tag) pairs to apply
+
+        Returns:
+            Dictionary mapping each found movie ID to its updated entity
+            (IDs that were not found are omitted)
+
+        Raises:
+            Repository exceptions: If retrieval or persistence fails
+
+        Application.Service.Command.Remove_Tags -> batch uncategorization of existing movies
+        """
+        # application.operation.batch_untagging -> delegate tag removal logic to domain entities
+        return self._apply_tag_updates(updates, Movie.remove_tag)
+
+    def _apply_tag_updates(
+        self,
+        updates: List[Tuple[str, str]],
+        operation: Callable[[Movie, str], None]
+    ) -> Dict[str, Movie]:
+        """
+        Apply a tag operation to a batch of movies with one fetch and one save.
+
+        Args:
+            updates: (movie_id, tag) pairs to apply
+            operation: Movie method applying one tag change
+
+        Returns:
+            Dictionary mapping each found movie ID to its entity
+
+        Application.Service.Command.Tag_Batch -> grouped retrieval, mutation, persistence
+        """
+        # application.operation.retrieval.batch -> fetch every distinct target at once
+        movies = self._repository.find_by_ids(dict.fromkeys(movie_id for movie_id, _ in updates))
+
+        # application.operation.domain_update.batch -> remember original tags to detect no-ops
+        original_tags = {movie_id: movie.tag_tuple for movie_id, movie in movies.items()}
+        for movie_id, tag in updates:
+            movie = movies.get(movie_id)
+            if movie is not None:
+                operation(movie, tag)
+
+        # application.operation.persistence.batch -> save only movies that actually changed
+        changed = [movie for movie_id, movie in movies.items() if movie.tag_tuple is not original_tags[movie_id]]
+        if changed:
+            self._repository.save_many(changed)
+            self._invalidate(movie.id for movie in changed)
+
+        # application.service.result.updated_entities -> return found entities
+        return movies
 
     def delete_movie(self, movie_id: str) -> bool:
         """
@@ -223,6 +360,22 @@ class MovieCommandService:
         """
         # application.operation.deletion -> delegate removal to repository
         deletion_result = self._repository.delete(movie_id)
+        if deletion_result:
+            self._invalidate([movie_id])
 
         # application.service.result.deletion_outcome -> return repository result
-        return deletion_result
\ No newline at end of file
+        return deletion_result
+
+    def _invalidate(self, movie_ids: Iterable[str]) -> None:
+        """
+        Evict changed movies from the query service's request memo.
+
+        Args:
+            movie_ids: Identifiers of movies that were saved or deleted
+
+        Application.Service.Command.Invalidate -> read-after-write consistency
+        """
+        # application.service.memo.invalidation -> only when a query service is wired in
+        if self._query_service is not None:
+            for movie_id in movie_ids:
+                self._query_service.invalidate(movie_id)
\ No newline at end of file
@@ -11,9 +11,100 @@ Domain responsibilities:
 - Identity management for movies
 """
 
-import uuid
+import os
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# domain.validation.rating.bounds -> acceptable rating scale
+_MIN_RATING: float = 1.0
+_MAX_RATING: float = 10.0
+
+# domain.validation.year.historical_minimum -> first motion pictures circa 1888
+_MIN_YEAR: int = 1888
+
+# domain.validation.year.future_buffer -> reasonable future production window
+_YEAR_BUFFER: int = 10
+
+# domain.time.cache.ttl_seconds -> how long a looked-up calendar year is reused
+_YEAR_CACHE_TTL: float = 60.0
+
+# domain.time.cache.state -> (cached year, monotonic timestamp of lookup)
+_year_cache: Tuple[int, float] = (0, float("-inf"))
+
+
+# domain.identity.pool.sizes -> 16 random bytes per id, refilled 256 ids at a time
+_ID_BYTES: int = 16
+_ID_POOL_SIZE: int = _ID_BYTES * 256
+
+# domain.identity.pool.state -> buffered randomness shared by all constructions
+_id_lock = threading.Lock()
+_id_pool: bytes = b""
+_id_offset: int = 0
+
+
+def _reset_id_pool() -> None:
+    """
+    Discard buffered randomness so a forked child never reuses parent ids.
+
+    Domain.Identity.Pool_Reset -> fork safety for buffered id generation
+    """
+    global _id_pool, _id_offset
+    _id_pool, _id_offset = b"", 0
+
+
+# domain.identity.pool.fork_safety -> children start with an empty pool
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _next_id() -> str:
+    """
+    Mint a random 128-bit identifier as a 32-character hex string.
+
+    Random bytes come from a buffered os.urandom pool so that bulk
+    construction amortizes one system call over many identifiers.
+
+    Returns:
+        Hex-encoded random identifier
+
+    Domain.Identity.Next_Id -> unique entity identity generation
+    """
+    global _id_pool, _id_offset
+
+    # domain.identity.pool.draw -> refill when exhausted, then slice next id
+    with _id_lock:
+        if _id_offset >= len(_id_pool):
+            _id_pool, _id_offset = os.urandom(_ID_POOL_SIZE), 0
+        start = _id_offset
+        _id_offset += _ID_BYTES
+        return _id_pool[start:_id_offset].hex()
+
+
+def _current_year() -> int:
+    """
+    Return the current calendar year, refreshed at most once per TTL.
+
+    Bulk construction validates a year for every movie; reusing the cached
+    value avoids building a datetime per entity.
+
+    Returns:
+        Current calendar year
+
+    Domain.Time.Current_Year -> cached clock reference for year validation
+    """
+    global _year_cache
+
+    # domain.time.cache.refresh -> re-read clock once the cached year expires
+    year, checked_at = _year_cache
+    now = time.monotonic()
+    if now - checked_at > _YEAR_CACHE_TTL:
+        year = datetime.now().year
+        _year_cache = (year, now)
+    return year
 
 
 class InvalidRatingError(ValueError):
@@ -55,6 +146,9 @@ class Movie:
     Domain.Entity.Movie -> central aggregate root for movie catalog
     """
 
+    # domain.movie.storage.slots -> fixed attribute layout, no per-instance __dict__
+    __slots__ = ("_id", "_title", "_year", "_description", "_rating", "_tags", "_tag_view")
+
     def __init__(
         self,
         title: str,
@@ -80,8 +174,8 @@ class Movie:
 
         Domain.Movie.Construction -> entity creation with business rule enforcement
         """
-        # domain.movie.identity.unique_id -> auto-generated UUID for entity identity
-        self._id: str = str(uuid.uuid4())
+        # domain.movie.identity.unique_id -> auto-generated random id for entity identity
+        self._id: str = _next_id()
 
         # domain.movie.validation.title -> ensure meaningful title content
         self._validate_and_set_title(title)
@@ -97,8 +191,71 @@ class Movie:
         if rating is not None:
             self._validate_and_set_rating(rating)
 
-        # domain.movie.classification.tags -> collection of category strings
-        self._tags: List[str] = tags.copy() if tags else []
+        # domain.movie.classification.tags -> insertion-ordered unique, interned category strings
+        self._tags: Dict[str, None] = dict.fromkeys(
+            sys.intern(tag.strip()) for tag in tags or () if tag and tag.strip()
+        )
+
+        # domain.movie.classification.tag_view -> immutable snapshot shared by readers
+        self._tag_view: Tuple[str, ...] = tuple(self._tags)
+
+    @classmethod
+    def from_record(
+        cls,
+        movie_id: str,
+        title: str,
+        year: int,
+        description: str,
+        rating: Optional[float],
+        tags: Iterable[str]
+    ) -> "Movie":
+        """
+        Rehydrate a movie from previously validated stored fields.
+
+        Storage adapters use this when loading entities that were validated
+        when they were first saved. Validation and normalization are skipped,
+        and the stored identifier is kept instead of minting a new one.
+
+        Args:
+            movie_id: Stored unique identifier
+            title: Stored (already stripped) title
+            year: Stored production year
+            description: Stored description
+            rating: Stored rating or None
+            tags: Stored unique, stripped tags in order
+
+        Returns:
+            Movie entity carrying exactly the stored state
+
+        Domain.Movie.Rehydration -> trusted reconstruction from persistence
+        """
+        # domain.movie.rehydration.allocate -> bypass validating constructor
+        movie = cls.__new__(cls)
+
+        # domain.movie.rehydration.assign -> copy stored fields verbatim
+        movie._id = movie_id
+        movie._title = title
+        movie._year = year
+        movie._description = description
+        movie._rating = rating
+        movie._tags = dict.fromkeys(tags)
+        movie._tag_view = tuple(movie._tags)
+        return movie
+
+    def to_record(self) -> Tuple[str, str, int, str, Optional[float], Tuple[str, ...]]:
+        """
+        Export the movie's state as a flat record in from_record argument order.
+
+        Adapters use this to serialize many entities without a property call
+        per field; the tags element is the shared immutable tuple view.
+
+        Returns:
+            Tuple of (id, title, year, description, rating, tags)
+
+        Domain.Movie.Export -> single-call snapshot of entity state
+        """
+        # domain.movie.export.fields -> read slots directly, no per-field descriptor calls
+        return (self._id, self._title, self._year, self._description, self._rating, self._tag_view)
 
     def _validate_and_set_title(self, title: str) -> None:
         """
@@ -131,19 +288,12 @@ class Movie:
 
         Domain.Movie.Validation.Year -> business rule for realistic production years
         """
-        # domain.time.reference.current -> current calendar year for validation
-        current_year: int = datetime.now().year
-
-        # domain.validation.year.historical_minimum -> first motion pictures circa 1888
-        min_year: int = 1888
-
-        # domain.validation.year.future_maximum -> reasonable future production buffer
-        max_year: int = current_year + 10
-
         # domain.validation.year.bounds_check -> enforce business rule constraints
-        if year < min_year:
-            raise InvalidYearError(f"Movie year {year} is before first motion pictures ({min_year})")
+        if year < _MIN_YEAR:
+            raise InvalidYearError(f"Movie year {year} is before first motion pictures ({_MIN_YEAR})")
 
+        # domain.validation.year.future_maximum -> cached current year plus buffer
+        max_year: int = _current_year() + _YEAR_BUFFER
         if year > max_year:
             raise InvalidYearError(f"Movie year {year} is too far in the future (max: {max_year})")
 
@@ -162,14 +312,10 @@ class Movie:
 
         Domain.Movie.Validation.Rating -> business rule for rating scale bounds
         """
-        # domain.validation.rating.bounds -> define acceptable rating range
-        min_rating: float = 1.0
-        max_rating: float = 10.0
-
         # domain.validation.rating.bounds_check -> enforce rating scale constraints
-        if rating < min_rating or rating > max_rating:
+        if not _MIN_RATING <= rating <= _MAX_RATING:
             raise InvalidRatingError(
-                f"Movie rating {rating} must be between {min_rating} and {max_rating}"
+                f"Movie rating {rating} must be between {_MIN_RATING} and {_MAX_RATING}"
             )
 
         # domain.movie.attribute.rating -> store validated rating
@@ -246,7 +392,20 @@ class Movie:
         Domain.Movie.Classification.Tags_Access -> category collection
         """
         # domain.encapsulation.defensive_copy -> prevent external mutation
-        return self._tags.copy()
+        return list(self._tags)
+
+    @property
+    def tag_tuple(self) -> Tuple[str, ...]:
+        """
+        Get the movie tags as an immutable tuple without copying.
+
+        Returns:
+            Tuple of categorization strings in insertion order
+
+        Domain.Movie.Classification.Tag_Tuple -> allocation-free category view
+        """
+        # domain.encapsulation.immutable_view -> tuple rebuilt only on mutation
+        return self._tag_view
 
     def rate(self, rating: float) -> None:
         """
@@ -273,9 +432,11 @@ class Movie:
         Domain.Movie.Behavior.Add_Tag -> business operation to categorize movie
         """
         # domain.movie.classification.tag_addition -> append new category
-        if tag and tag.strip() and tag.strip() not in self._tags:
-            # domain.movie.state.tags_collection -> maintain unique categorizations
-            self._tags.append(tag.strip())
+        tag = sys.intern(tag.strip()) if tag else ""
+        if tag and tag not in self._tags:
+            # domain.movie.state.tags_collection -> dict keys keep order and uniqueness
+            self._tags[tag] = None
+            self._tag_view = self._tag_view + (tag,)
 
     def remove_tag(self, tag: str) -> None:
         """
@@ -288,5 +449,21 @@ class Movie:
         """
         # domain.movie.classification.tag_removal -> safe removal operation
         if tag in self._tags:
-            # domain.movie.state.tags_modification -> update category collection
-            self._tags.remove(tag)
\ No newline at end of file
+            # domain.movie.state.tags_modification -> constant-time keyed removal
+            del self._tags[tag]
+            self._tag_view = tuple(self._tags)
+
+    def has_tag(self, tag: str) -> bool:
+        """
+        Check whether the movie carries a categorization tag.
+
+        Args:
+            tag: Category string to look for (matched exactly, like remove_tag)
+
+        Returns:
+            True if the tag is present
+
+        Domain.Movie.Query.Has_Tag -> constant-time membership without copying tags
+        """
+        # domain.movie.classification.membership -> direct keyed lookup
+        return tag in self._tags
\ No newline at end of file
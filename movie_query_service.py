@@ -13,11 +13,19 @@ Application layer responsibilities:
 - Handle application-specific query logic
 """
 
-from typing import List, Optional, Dict, Any, Set
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import List, Optional, Dict, Any, Iterator
 from movie_domain import Movie
 from movie_repository import MovieRepository
 
 
+# application.service.memo.request_scope -> service instance -> per-request identity lookups (None outside a scope)
+_ID_MEMOS: "ContextVar[Optional[Dict[MovieQueryService, Dict[str, Movie]]]]" = ContextVar(
+    "movie_id_memos", default=None
+)
+
+
 class MovieQueryService:
     """
     Application service for movie query operations.
@@ -42,18 +50,98 @@ class MovieQueryService:
         # application.service.dependency.repository -> injected storage abstraction
         self._repository: MovieRepository = repository
 
-    def get_all_movies(self) -> List[Movie]:
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        """
+        Memoize movie lookups by identifier for the duration of one request.
+
+        Repeated get_movie_by_id calls with the same identifier inside the
+        scope reuse the first result instead of querying the repository
+        again. The memo is bound to the current context, so concurrent
+        requests never see each other's entries.
+
+        Application.Service.Query.Request_Scope -> request-bounded identity memo
+        """
+        token = self.begin_request_scope()
+        try:
+            yield
+        finally:
+            self.end_request_scope(token)
+
+    def begin_request_scope(self) -> Token:
+        """
+        Activate a fresh identity memo for the current context.
+
+        Returns:
+            Token to pass to end_request_scope when the request finishes
+
+        Application.Service.Query.Begin_Scope -> hook for adapters without a with-block
+        """
+        # application.service.memo.activation -> fresh memo for this service, others kept as they are
+        memos = _ID_MEMOS.get()
+        return _ID_MEMOS.set({**(memos or {}), self: {}})
+
+    def end_request_scope(self, token: Token) -> None:
+        """
+        Discard the identity memo activated by begin_request_scope.
+
+        Args:
+            token: Token returned by begin_request_scope
+
+        Application.Service.Query.End_Scope -> release request-bounded memo
+        """
+        # application.service.memo.release -> drop memo when the request ends
+        _ID_MEMOS.reset(token)
+
+    def _request_memo(self) -> Optional[Dict[str, Movie]]:
         """
-        Retrieve all movies from the catalog.
+        Get this service's identity memo in the current context.
 
         Returns:
-            List containing all movies in the catalog, or empty list if none exist
+            Memo dictionary, or None outside a request scope
+
+        Application.Service.Query.Memo -> current request memo lookup
+        """
+        # application.service.memo.lookup -> one shared context variable for every service
+        memos = _ID_MEMOS.get()
+        return memos.get(self) if memos is not None else None
+
+    def invalidate(self, movie_id: str) -> None:
+        """
+        Forget any memoized lookup for a movie in the current request scope.
+
+        Args:
+            movie_id: Unique identifier of the movie that was saved or deleted
+
+        Application.Service.Query.Invalidate -> keep request memo consistent with commands
+        """
+        # application.service.memo.eviction -> no-op outside a request scope
+        memo = self._request_memo()
+        if memo is not None:
+            memo.pop(movie_id, None)
+
+    def get_all_movies(self, limit: Optional[int] = None, offset: int = 0) -> List[Movie]:
+        """
+        Retrieve all movies from the catalog, optionally one page at a time.
+
+        Args:
+            limit: Maximum number of movies to return (None for all)
+            offset: Number of movies to skip
+
+        Returns:
+            List containing all movies in the catalog (or the requested page),
+            or empty list if none exist
 
         Raises:
+            InvalidFilterError: If limit or offset is negative
             Repository exceptions: If retrieval operation fails
 
         Application.Service.Query.Get_All -> retrieve complete movie collection
         """
+        # application.operation.retrieval.page -> bounded window when requested
+        if limit is not None or offset:
+            return self._repository.find_all(limit=limit, offset=offset)
+
         # application.operation.retrieval.complete -> delegate to repository
         return self._repository.find_all()
 
@@ -72,8 +160,18 @@ class MovieQueryService:
 
         Application.Service.Query.Get_By_Id -> retrieve single movie by identity
         """
+        # application.operation.retrieval.memoized -> reuse lookups made earlier in this request
+        memo = self._request_memo()
+        if memo is not None and movie_id in memo:
+            return memo[movie_id]
+
         # application.operation.retrieval.by_identity -> delegate to repository
-        return self._repository.find_by_id(movie_id)
+        movie = self._repository.find_by_id(movie_id)
+
+        # application.service.memo.store_hit -> only found movies are memoized
+        if memo is not None and movie is not None:
+            memo[movie_id] = movie
+        return movie
 
     def search_movies_by_title(self, title: str) -> List[Movie]:
         """
@@ -165,7 +263,9 @@ class MovieQueryService:
         year: Optional[int] = None,
         rating_min: Optional[float] = None,
         rating_max: Optional[float] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Movie]:
         """
         Perform comprehensive movie search with multiple filter criteria.
@@ -180,6 +280,8 @@ class MovieQueryService:
             rating_min: Minimum rating threshold (inclusive)
             rating_max: Maximum rating threshold (inclusive)
             tags: List of tags that must all be present
+            limit: Maximum number of movies to return (None for all)
+            offset: Number of matching movies to skip
 
         Returns:
             List of movies matching all specified criteria
@@ -190,8 +292,57 @@ class MovieQueryService:
 
         Application.Service.Query.Search_Complex -> multi-criteria filtering operation
         """
+        # application.operation.search.pagination -> forward page window only when requested
+        page: Dict[str, Any] = {}
+        if limit is not None or offset:
+            page = {"limit": limit, "offset": offset}
+
         # application.operation.search.complex -> delegate comprehensive filtering to repository
         return self._repository.find_by_filters(
+            title=title,
+            year=year,
+            rating_min=rating_min,
+            rating_max=rating_max,
+            tags=tags,
+            **page
+        )
+
+    def iter_movies(
+        self,
+        title: Optional[str] = None,
+        year: Optional[int] = None,
+        rating_min: Optional[float] = None,
+        rating_max: Optional[float] = None,
+        tags: Optional[List[str]] = None
+    ) -> Iterator[Movie]:
+        """
+        Lazily iterate over movies matching all provided criteria.
+
+        With no criteria the whole catalog is streamed. Intended for consumers
+        that emit results incrementally instead of building a full list.
+
+        Args:
+            title: Partial title to search for (case-insensitive)
+            year: Specific release year to match
+            rating_min: Minimum rating threshold (inclusive)
+            rating_max: Maximum rating threshold (inclusive)
+            tags: List of tags that must all be present
+
+        Returns:
+            Iterator over movies matching all specified criteria
+
+        Raises:
+            InvalidFilterError: If filter criteria are invalid
+            Repository exceptions: If retrieval operation fails
+
+        Application.Service.Query.Iterate -> streaming multi-criteria retrieval
+        """
+        # application.operation.stream.complete -> no criteria streams the whole catalog
+        if title is None and year is None and rating_min is None and rating_max is None and tags is None:
+            return self._repository.iter_all()
+
+        # application.operation.stream.filtered -> delegate incremental filtering to repository
+        return self._repository.iter_by_filters(
             title=title,
             year=year,
             rating_min=rating_min,
@@ -234,40 +385,18 @@ class MovieQueryService:
 
         Application.Service.Query.Statistics -> aggregate information operation
         """
-        # application.operation.retrieval.all_data -> get complete dataset for analysis
-        all_movies = self._repository.find_all()
-        total_count = self._repository.count()
-
-        # application.calculation.statistics.initialization -> setup calculation variables
-        movies_with_ratings = 0
-        total_rating = 0.0
-        unique_tags: Set[str] = set()
-        years = []
-
-        # application.calculation.statistics.aggregation -> process each movie for statistics
-        for movie in all_movies:
-            # application.statistics.rating.accumulation -> collect rating data
-            if movie.rating is not None:
-                movies_with_ratings += 1
-                total_rating += movie.rating
-
-            # application.statistics.tags.collection -> collect unique tags
-            unique_tags.update(movie.tags)
-
-            # application.statistics.years.collection -> collect year data
-            years.append(movie.year)
+        # application.operation.retrieval.aggregates -> repository supplies raw figures
+        figures = self._repository.statistics()
+        movies_with_ratings = figures["movies_with_ratings"]
 
         # application.calculation.rating.average -> compute average rating
-        average_rating = round(total_rating / movies_with_ratings, 2) if movies_with_ratings > 0 else 0.0
-
-        # application.calculation.years.range -> determine year span
-        year_range = (min(years), max(years)) if years else None
+        average_rating = round(figures["rating_sum"] / movies_with_ratings, 2) if movies_with_ratings > 0 else 0.0
 
         # application.service.result.statistics -> return comprehensive statistics
         return {
-            "total_movies": total_count,
+            "total_movies": figures["total_movies"],
             "movies_with_ratings": movies_with_ratings,
             "average_rating": average_rating,
-            "unique_tags": unique_tags,
-            "year_range": year_range
-        }
\ No newline at end of file
+            "unique_tags": figures["unique_tags"],
+            "year_range": figures["year_range"]
+        }
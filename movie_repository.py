@@ -9,13 +9,19 @@ Port responsibilities:
 - Abstract interface for movie storage operations
 - Filter value objects for search criteria
 - Storage operation contracts (save, find, delete, count)
+- Default aggregate computations adapters may override with faster versions
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
 from movie_domain import Movie
 
 
+# domain.validation.rating.absolute_bounds -> same as movie entity bounds
+_MIN_VALID_RATING: float = 1.0
+_MAX_VALID_RATING: float = 10.0
+
+
 class InvalidFilterError(ValueError):
     """
     Raised when filter criteria violate business rules.
@@ -25,6 +31,32 @@ class InvalidFilterError(ValueError):
     pass
 
 
+def page_slice(limit: Optional[int] = None, offset: int = 0) -> slice:
+    """
+    Validate pagination arguments and convert them into a slice.
+
+    Args:
+        limit: Maximum number of results to return (None for no limit)
+        offset: Number of leading results to skip
+
+    Returns:
+        Slice selecting the requested page of an ordered result
+
+    Raises:
+        InvalidFilterError: If limit or offset is negative
+
+    Domain.Filter.Pagination -> business rule for result windows
+    """
+    # domain.validation.pagination.bounds -> windows cannot be negative
+    if limit is not None and limit < 0:
+        raise InvalidFilterError(f"Limit {limit} cannot be negative")
+    if offset < 0:
+        raise InvalidFilterError(f"Offset {offset} cannot be negative")
+
+    # domain.filter.pagination.window -> open-ended when no limit given
+    return slice(offset, None if limit is None else offset + limit)
+
+
 class MovieFilters:
     """
     Value object encapsulating movie search and filter criteria.
@@ -33,9 +65,15 @@ class MovieFilters:
     in the catalog. It encapsulates validation logic and provides
     a clean interface for complex filtering operations.
 
+    Filters are immutable and compare by value, so they can be used as
+    dictionary keys (for example to memoize search results).
+
     Domain.ValueObject.MovieFilters -> search criteria encapsulation
     """
 
+    # domain.filter.storage.slots -> fixed attribute layout, no per-instance __dict__
+    __slots__ = ("_title", "_year", "_rating_min", "_rating_max", "_tags", "_key", "_is_empty")
+
     def __init__(
         self,
         title: Optional[str] = None,
@@ -73,8 +111,42 @@ class MovieFilters:
         if rating_min is not None or rating_max is not None:
             self._validate_and_set_rating_range(rating_min, rating_max)
 
-        # domain.filter.classification.tags -> optional category filtering
-        self._tags: List[str] = tags.copy() if tags else []
+        # domain.filter.classification.tags -> optional category filtering (immutable)
+        self._tags: Tuple[str, ...] = tuple(tags) if tags else ()
+
+        # domain.filter.identity.key -> value identity, tag order irrelevant to matching
+        self._key: Tuple[Any, ...] = (
+            self._title, self._year, self._rating_min, self._rating_max,
+            tuple(sorted(set(self._tags)))
+        )
+
+        # domain.filter.state.empty -> criteria are fixed, so decide emptiness once
+        self._is_empty: bool = self._key == (None, None, None, None, ())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Allow attribute assignment only while the filter is being constructed.
+
+        Raises:
+            AttributeError: If the filter has already been constructed
+
+        Domain.Filter.Immutability -> criteria fixed after construction
+        """
+        # domain.filter.immutability.frozen -> the last slot set in __init__ marks completion
+        if hasattr(self, "_is_empty"):
+            raise AttributeError(f"MovieFilters is immutable; cannot set {name!r}")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """
+        Reject attribute deletion on a constructed filter.
+
+        Raises:
+            AttributeError: Always, filters are immutable
+
+        Domain.Filter.Immutability -> criteria fixed after construction
+        """
+        raise AttributeError(f"MovieFilters is immutable; cannot delete {name!r}")
 
     def _validate_and_set_rating_range(
         self,
@@ -93,23 +165,19 @@ class MovieFilters:
 
         Domain.Filter.Validation.Rating_Range -> business rule for rating bounds
         """
-        # domain.validation.rating.absolute_bounds -> same as movie entity bounds
-        min_valid_rating: float = 1.0
-        max_valid_rating: float = 10.0
-
         # domain.validation.filter.rating_minimum -> minimum rating bound check
         if rating_min is not None:
-            if rating_min < min_valid_rating or rating_min > max_valid_rating:
+            if not _MIN_VALID_RATING <= rating_min <= _MAX_VALID_RATING:
                 raise InvalidFilterError(
-                    f"Minimum rating {rating_min} must be between {min_valid_rating} and {max_valid_rating}"
+                    f"Minimum rating {rating_min} must be between {_MIN_VALID_RATING} and {_MAX_VALID_RATING}"
                 )
             self._rating_min = rating_min
 
         # domain.validation.filter.rating_maximum -> maximum rating bound check
         if rating_max is not None:
-            if rating_max < min_valid_rating or rating_max > max_valid_rating:
+            if not _MIN_VALID_RATING <= rating_max <= _MAX_VALID_RATING:
                 raise InvalidFilterError(
-                    f"Maximum rating {rating_max} must be between {min_valid_rating} and {max_valid_rating}"
+                    f"Maximum rating {rating_max} must be between {_MIN_VALID_RATING} and {_MAX_VALID_RATING}"
                 )
             self._rating_max = rating_max
 
@@ -179,8 +247,38 @@ class MovieFilters:
 
         Domain.Filter.Access.Tags -> category filtering criteria
         """
-        # domain.encapsulation.defensive_copy -> prevent external mutation
-        return self._tags.copy()
+        # domain.encapsulation.defensive_copy -> list view of immutable storage
+        return list(self._tags)
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """
+        Get the normalized, hashable form of these criteria.
+
+        Returns:
+            Tuple of (title, year, rating_min, rating_max, sorted unique tags)
+
+        Domain.Filter.Access.Key -> cache key for equivalent searches
+        """
+        return self._key
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare filters by their normalized criteria.
+
+        Domain.Filter.Equality -> value object semantics
+        """
+        if not isinstance(other, MovieFilters):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        """
+        Hash filters by their normalized criteria.
+
+        Domain.Filter.Hash -> usable as a memoization key
+        """
+        return hash(self._key)
 
     def is_empty(self) -> bool:
         """
@@ -191,14 +289,8 @@ class MovieFilters:
 
         Domain.Filter.State.Empty_Check -> detect no-filter condition
         """
-        # domain.filter.state.empty_detection -> check all criteria unset
-        return (
-            self._title is None and
-            self._year is None and
-            self._rating_min is None and
-            self._rating_max is None and
-            len(self._tags) == 0
-        )
+        # domain.filter.state.empty_detection -> precomputed at construction
+        return self._is_empty
 
 
 class MovieRepository(ABC):
@@ -226,6 +318,22 @@ class MovieRepository(ABC):
         # domain.operation.persistence.save -> abstract storage operation
         pass
 
+    def save_many(self, movies: Iterable[Movie]) -> None:
+        """
+        Persist several movie entities to storage.
+
+        The default implementation saves each movie in turn. Adapters that
+        can apply a batch more cheaply than individual saves should override it.
+
+        Args:
+            movies: Movie entities to store
+
+        Domain.Port.Repository.Save_Many -> batch persistence operation contract
+        """
+        # domain.operation.persistence.save_many -> fall back to individual saves
+        for movie in movies:
+            self.save(movie)
+
     @abstractmethod
     def find_by_id(self, movie_id: str) -> Optional[Movie]:
         """
@@ -242,19 +350,64 @@ class MovieRepository(ABC):
         # domain.operation.retrieval.by_id -> abstract identity lookup
         pass
 
+    def find_by_ids(self, movie_ids: Iterable[str]) -> Dict[str, Movie]:
+        """
+        Retrieve several movies by their unique identifiers.
+
+        The default implementation looks each identifier up in turn.
+        Adapters that can fetch a batch in one operation should override it.
+
+        Args:
+            movie_ids: Unique identifiers of the movies to retrieve
+
+        Returns:
+            Dictionary mapping each found identifier to its movie (unknown IDs omitted)
+
+        Domain.Port.Repository.Find_By_Ids -> batch retrieval by identity contract
+        """
+        # domain.operation.retrieval.by_ids -> fall back to individual lookups
+        found: Dict[str, Movie] = {}
+        for movie_id in movie_ids:
+            movie = self.find_by_id(movie_id)
+            if movie is not None:
+                found[movie_id] = movie
+        return found
+
     @abstractmethod
-    def find_all(self) -> List[Movie]:
+    def find_all(self, limit: Optional[int] = None, offset: int = 0) -> List[Movie]:
         """
-        Retrieve all movies from storage.
+        Retrieve all movies from storage, optionally one page at a time.
+
+        Args:
+            limit: Maximum number of movies to return (None for all)
+            offset: Number of movies to skip, in insertion order
 
         Returns:
-            List of all stored movie entities
+            List of all stored movie entities (or the requested page)
+
+        Raises:
+            InvalidFilterError: If limit or offset is negative
 
         Domain.Port.Repository.Find_All -> complete collection retrieval contract
         """
         # domain.operation.retrieval.all -> abstract collection access
         pass
 
+    def iter_all(self) -> Iterator[Movie]:
+        """
+        Iterate over all movies in storage without building a list.
+
+        The default implementation iterates over find_all(). Adapters that
+        can stream their stored entities directly should override it.
+
+        Returns:
+            Iterator over all stored movie entities
+
+        Domain.Port.Repository.Iter_All -> streaming collection retrieval contract
+        """
+        # domain.operation.retrieval.stream -> fall back to the materialized collection
+        return iter(self.find_all())
+
     @abstractmethod
     def find_by_filters(
         self,
@@ -262,26 +415,113 @@ class MovieRepository(ABC):
         year: Optional[int] = None,
         rating_min: Optional[float] = None,
         rating_max: Optional[float] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Movie]:
         """
         Retrieve movies matching the specified filter criteria.
 
+        Adapters are expected to evaluate the criteria in storage (indexes,
+        query pushdown) and to apply the page window before materializing
+        entities. With no criteria the result equals find_all(). Otherwise
+        cheap predicates should run first: exact year, then rating range,
+        then tag subset, then title substring, so that each one only sees
+        the survivors of the cheaper checks.
+
         Args:
             title: Partial title to search for (case-insensitive)
             year: Specific release year to match
             rating_min: Minimum rating threshold (inclusive)
             rating_max: Maximum rating threshold (inclusive)
             tags: List of tags that must all be present on matching movies
+            limit: Maximum number of movies to return (None for all)
+            offset: Number of matching movies to skip, in insertion order
 
         Returns:
             List of movie entities matching all specified criteria
 
+        Raises:
+            InvalidFilterError: If limit or offset is negative
+
         Domain.Port.Repository.Find_By_Filters -> filtered search contract
         """
         # domain.operation.retrieval.filtered -> abstract search operation
         pass
 
+    def iter_by_filters(
+        self,
+        title: Optional[str] = None,
+        year: Optional[int] = None,
+        rating_min: Optional[float] = None,
+        rating_max: Optional[float] = None,
+        tags: Optional[List[str]] = None
+    ) -> Iterator[Movie]:
+        """
+        Iterate over movies matching the specified filter criteria.
+
+        The default implementation iterates over find_by_filters(). Adapters
+        that can evaluate filters incrementally should override it, so that
+        consumers which stop early (existence checks, first page) avoid
+        building the full result.
+
+        Args:
+            title: Partial title to search for (case-insensitive)
+            year: Specific release year to match
+            rating_min: Minimum rating threshold (inclusive)
+            rating_max: Maximum rating threshold (inclusive)
+            tags: List of tags that must all be present on matching movies
+
+        Returns:
+            Iterator over movie entities matching all specified criteria
+
+        Domain.Port.Repository.Iter_By_Filters -> streaming filtered search contract
+        """
+        # domain.operation.retrieval.filtered_stream -> fall back to the materialized result
+        return iter(self.find_by_filters(
+            title=title,
+            year=year,
+            rating_min=rating_min,
+            rating_max=rating_max,
+            tags=tags
+        ))
+
+    def count_by_filters(
+        self,
+        title: Optional[str] = None,
+        year: Optional[int] = None,
+        rating_min: Optional[float] = None,
+        rating_max: Optional[float] = None,
+        tags: Optional[List[str]] = None
+    ) -> int:
+        """
+        Count movies matching the specified filter criteria.
+
+        The default implementation counts the results of iter_by_filters().
+        Adapters that can count matches without building entities (an
+        aggregate query, a cached ID list) should override it.
+
+        Args:
+            title: Partial title to search for (case-insensitive)
+            year: Specific release year to match
+            rating_min: Minimum rating threshold (inclusive)
+            rating_max: Maximum rating threshold (inclusive)
+            tags: List of tags that must all be present on matching movies
+
+        Returns:
+            Number of movies matching all specified criteria
+
+        Domain.Port.Repository.Count_By_Filters -> filtered count contract
+        """
+        # domain.operation.aggregation.filtered_count -> count the streamed matches
+        return sum(1 for _ in self.iter_by_filters(
+            title=title,
+            year=year,
+            rating_min=rating_min,
+            rating_max=rating_max,
+            tags=tags
+        ))
+
     @abstractmethod
     def delete(self, movie_id: str) -> bool:
         """
@@ -309,4 +549,87 @@ class MovieRepository(ABC):
         Domain.Port.Repository.Count -> collection size contract
         """
         # domain.operation.aggregation.count -> abstract size operation
-        pass
\ No newline at end of file
+        pass
+
+    def delete_many(self, movie_ids: Iterable[str]) -> int:
+        """
+        Remove several movies from storage by their unique identifiers.
+
+        The default implementation deletes each movie in turn. Adapters that
+        can apply a batch more cheaply than individual deletes should override it.
+
+        Args:
+            movie_ids: Unique identifiers of the movies to remove
+
+        Returns:
+            Number of movies that were found and deleted
+
+        Domain.Port.Repository.Delete_Many -> batch removal operation contract
+        """
+        # domain.operation.removal.delete_many -> fall back to individual deletes
+        return sum(1 for movie_id in movie_ids if self.delete(movie_id))
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Compute raw aggregate figures over the stored collection.
+
+        The default implementation walks every stored movie. Adapters that
+        can maintain these figures incrementally should override it.
+
+        Returns:
+            Dictionary containing:
+            - total_movies: Total number of stored movies
+            - movies_with_ratings: Count of movies that have ratings
+            - rating_sum: Sum of all ratings of rated movies
+            - unique_tags: Set of all distinct tags in use
+            - year_range: Tuple of (earliest_year, latest_year) or None if empty
+
+        Domain.Port.Repository.Statistics -> aggregate figures contract
+        """
+        # domain.operation.aggregation.initialization -> setup running totals
+        total_movies = 0
+        movies_with_ratings = 0
+        rating_sum = 0.0
+        unique_tags: Set[str] = set()
+        add_tags = unique_tags.update
+        min_year: Optional[int] = None
+        max_year: Optional[int] = None
+
+        # domain.operation.aggregation.scan -> single fused pass, each attribute read once
+        for movie in self.iter_all():
+            total_movies += 1
+            rating = movie.rating
+            if rating is not None:
+                movies_with_ratings += 1
+                rating_sum += rating
+            add_tags(movie.tag_tuple)
+            year = movie.year
+            if min_year is None or year < min_year:
+                min_year = year
+            if max_year is None or year > max_year:
+                max_year = year
+
+        # domain.operation.aggregation.result -> raw figures for the application layer
+        return {
+            "total_movies": total_movies,
+            "movies_with_ratings": movies_with_ratings,
+            "rating_sum": rating_sum,
+            "unique_tags": unique_tags,
+            "year_range": None if min_year is None else (min_year, max_year)
+        }
+
+    def version(self) -> Optional[Hashable]:
+        """
+        Get a token that changes whenever the stored catalog changes.
+
+        Callers may reuse results computed while the token was the same,
+        whichever client performed the writes. The default returns None,
+        meaning the adapter cannot tell and results must not be reused.
+
+        Returns:
+            Opaque state token, or None if the adapter does not track changes
+
+        Domain.Port.Repository.Version -> catalog change token contract
+        """
+        # domain.operation.version.unknown -> no token, nothing may be cached
+        return None
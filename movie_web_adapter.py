@@ -14,14 +14,158 @@ Web adapter responsibilities:
 - Serve as alternative to CLI adapter
 """
 
-from flask import Flask, request, jsonify
-from typing import Dict, Any, List, Optional
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from flask import Flask, Response, request, jsonify, g, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
+from werkzeug.serving import WSGIRequestHandler
+from typing import Dict, Any, Callable, Hashable, List, Optional, Tuple
 from movie_domain import Movie, InvalidRatingError, InvalidTitleError, InvalidYearError
 from movie_repository import MovieRepository, InvalidFilterError
 from movie_command_service import MovieCommandService
 from movie_query_service import MovieQueryService
 from in_memory_repository import InMemoryMovieRepository
 
+# adapter.web.serialization.optional_backend -> orjson when installed, stdlib json otherwise
+try:
+    import orjson
+except ImportError:  # adapter.web.serialization.fallback -> keep Flask's default provider
+    orjson = None
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson.
+
+    Keeps the default provider's key sorting, compact/debug formatting,
+    and fallback conversions (dates, decimals, dataclasses), while moving
+    the per-value encoding and request-body parsing into orjson's C
+    implementation.
+
+    Adapter.Web.Serialization.Orjson -> fast JSON encoding for responses
+    """
+
+    def _options(self) -> int:
+        """
+        Build orjson option flags matching the provider settings.
+
+        Returns:
+            Bit flags for orjson.dumps
+
+        Adapter.Web.Serialization.Options -> parity with default provider
+        """
+        # adapter.web.serialization.options -> sorted keys like stdlib provider
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as a JSON string.
+
+        Args:
+            obj: Data to serialize
+            **kwargs: json.dumps arguments (stdlib encoding is used when given)
+
+        Returns:
+            JSON text
+
+        Adapter.Web.Serialization.Dumps -> orjson-backed string encoding
+        """
+        # adapter.web.serialization.custom_args -> stdlib handles json.dumps-specific options
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON text or UTF-8 bytes.
+
+        Used by request.get_json(), so request bodies are parsed straight
+        from bytes; malformed input raises a ValueError subclass, which
+        Flask turns into a 400 response.
+
+        Args:
+            s: JSON text or UTF-8 bytes
+            **kwargs: json.loads arguments (stdlib decoding is used when given)
+
+        Returns:
+            Decoded Python value
+
+        Adapter.Web.Serialization.Loads -> orjson-backed request parsing
+        """
+        # adapter.web.serialization.custom_args -> stdlib handles json.loads-specific options
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments into a JSON response.
+
+        Returns:
+            Flask response with the encoded JSON body
+
+        Adapter.Web.Serialization.Response -> bytes straight into the response body
+        """
+        # adapter.web.serialization.payload -> same argument handling as jsonify
+        obj = self._prepare_response_obj(args, kwargs)
+
+        # adapter.web.serialization.formatting -> indented output in debug mode
+        option = self._options() | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option), mimetype=self.mimetype
+        )
+
+
+# adapter.web.cache.read_capacity -> serialized read responses kept per application
+_READ_CACHE_SIZE: int = 256
+
+# adapter.web.errors.static_bodies -> fixed error payloads, encoded once in the jsonify wire format
+_ERROR_JSON_PAYLOAD_REQUIRED: bytes = b'{"error":"JSON payload required"}\n'
+_ERROR_RATING_REQUIRED: bytes = b'{"error":"Rating value required"}\n'
+_ERROR_TAG_REQUIRED: bytes = b'{"error":"Tag value required"}\n'
+_ERROR_NOT_FOUND: bytes = b'{"error":"Resource not found"}\n'
+_ERROR_METHOD_NOT_ALLOWED: bytes = b'{"error":"Method not allowed"}\n'
+_ERROR_INTERNAL: bytes = b'{"error":"Internal server error"}\n'
+
+
+def _static_error(body: bytes, status: int) -> Response:
+    """
+    Wrap a pre-encoded error payload in a fresh JSON response.
+
+    Args:
+        body: Encoded JSON error document
+        status: HTTP status code
+
+    Returns:
+        Response carrying the payload without re-serializing it
+
+    Adapter.Web.Errors.Static -> constant error replies skip dict building and encoding
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+
+# adapter.web.request.required_fields -> movie creation payload keys, in reporting order
+_REQUIRED_MOVIE_FIELDS: Tuple[str, ...] = ('title', 'year', 'description')
+_REQUIRED_MOVIE_FIELD_SET: frozenset = frozenset(_REQUIRED_MOVIE_FIELDS)
+
+# adapter.web.request.filter_params -> (query parameter, search criterion, parser) table
+_MOVIE_FILTER_PARAMS: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ('title', 'title', str),
+    ('year', 'year', int),
+    ('min_rating', 'rating_min', float),
+    ('max_rating', 'rating_max', float),
+    ('tags', 'tags', lambda value: value.split(',')),
+)
+
 
 def create_app(repository: MovieRepository) -> Flask:
     """
@@ -38,12 +182,71 @@ def create_app(repository: MovieRepository) -> Flask:
     # adapter.web.flask.creation -> create Flask application instance
     app = Flask(__name__)
 
+    # adapter.web.serialization.provider -> route jsonify through orjson when available
+    if orjson is not None:
+        app.json = _OrjsonProvider(app)
+
     # adapter.web.services.application_layer -> create coordinated application services
-    command_service = MovieCommandService(repository)
     query_service = MovieQueryService(repository)
+    command_service = MovieCommandService(repository, query_service=query_service)
+
+    # adapter.web.request.memo_scope -> memoize identity lookups for one request
+    @app.before_request
+    def open_query_scope():
+        g.query_scope_token = query_service.begin_request_scope()
+
+    @app.teardown_request
+    def close_query_scope(error=None):
+        token = g.pop('query_scope_token', None)
+        if token is not None:
+            query_service.end_request_scope(token)
+
+    # adapter.web.cache.read_responses -> LRU of (repository version, body) keyed on path + query string
+    read_cache: "OrderedDict[Tuple[str, bytes], Tuple[Hashable, bytes]]" = OrderedDict()
+    read_cache_lock = threading.Lock()
+
+    def cached_read(view: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Serve repeated reads from the pre-serialized response cache.
+
+        Only successful JSON responses are stored; errors always re-run the view.
+        Entries are tagged with the repository version they were computed
+        against, so writes made through any client make them stale.
+        Repositories without a version token are never cached.
+
+        Adapter.Web.Cache.Read -> replay identical GET responses without re-querying
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # adapter.web.cache.version -> token read before the view, so racing writes never match
+            version = repository.version()
+            if version is None:
+                return view(*args, **kwargs)
+
+            # adapter.web.cache.key -> resolve the request proxy once per lookup
+            current_request = request._get_current_object()
+            cache_key = (current_request.path, current_request.query_string)
+            with read_cache_lock:
+                entry = read_cache.get(cache_key)
+                if entry is not None and entry[0] == version:
+                    read_cache.move_to_end(cache_key)
+                    return Response(entry[1], mimetype='application/json')
+
+            result = view(*args, **kwargs)
+            # adapter.web.cache.store -> streamed bodies are never drained into the cache
+            if isinstance(result, Response) and result.status_code == 200 and not result.is_streamed:
+                with read_cache_lock:
+                    read_cache[cache_key] = (version, result.get_data())
+                    read_cache.move_to_end(cache_key)
+                    if len(read_cache) > _READ_CACHE_SIZE:
+                        read_cache.popitem(last=False)
+            return result
+
+        return wrapper
 
     # adapter.web.routes.movies -> movie CRUD endpoints
     @app.route('/movies', methods=['GET'])
+    @cached_read
     def get_movies():
         """
         Get all movies or filter movies based on query parameters.
@@ -54,50 +257,45 @@ def create_app(repository: MovieRepository) -> Flask:
         - min_rating: Minimum rating filter
         - max_rating: Maximum rating filter
         - tags: Comma-separated list of required tags
+        - format: 'json' (default) for an array, 'ndjson' to stream one object per line
 
         Returns:
-            JSON array of movie objects
+            JSON array of movie objects, or a newline-delimited JSON stream
 
         Adapter.Web.Endpoint.Get_Movies -> retrieve movie collection with optional filtering
         """
-        try:
-            # adapter.web.request.query_params -> extract filtering parameters
-            title = request.args.get('title')
-            year_str = request.args.get('year')
-            min_rating_str = request.args.get('min_rating')
-            max_rating_str = request.args.get('max_rating')
-            tags_str = request.args.get('tags')
-
-            # adapter.web.parsing.parameters -> convert string parameters to appropriate types
-            year = int(year_str) if year_str else None
-            min_rating = float(min_rating_str) if min_rating_str else None
-            max_rating = float(max_rating_str) if max_rating_str else None
-            tags = tags_str.split(',') if tags_str else None
-
-            # adapter.web.service.query -> execute search through query service
-            if not any([title, year, min_rating, max_rating, tags]):
-                # No filters specified, get all movies
-                movies = query_service.get_all_movies()
-            else:
-                # Filters specified, use search
-                movies = query_service.search_movies(
-                    title=title,
-                    year=year,
-                    rating_min=min_rating,
-                    rating_max=max_rating,
-                    tags=tags
-                )
-
-            # adapter.web.serialization.movies -> convert movies to JSON-serializable format
-            return jsonify([_movie_to_dict(movie) for movie in movies])
-
-        except (ValueError, InvalidFilterError) as e:
-            # adapter.web.error.bad_request -> handle parameter validation errors
-            return jsonify({'error': str(e)}), 400
-
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.request.query_params -> parse only the parameters actually supplied
+        get_arg = request.args.get
+        criteria: Dict[str, Any] = {}
+        for param, criterion, parse in _MOVIE_FILTER_PARAMS:
+            raw_value = get_arg(param)
+            if raw_value:
+                try:
+                    criteria[criterion] = parse(raw_value)
+                except ValueError:
+                    # adapter.web.validation.query_value -> unparsable input is a filter error, not an internal one
+                    raise InvalidFilterError(f"Invalid value for {param}: {raw_value!r}") from None
+
+        # adapter.web.response.ndjson -> stream one encoded movie per line, never holding the full list
+        response_format = get_arg('format', 'json')
+        if response_format == 'ndjson':
+            movies = query_service.iter_movies(**criteria)
+            dumps = app.json.dumps
+            lines = (dumps(_movie_to_dict(movie)) + '\n' for movie in movies)
+            return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+        if response_format != 'json':
+            raise InvalidFilterError(f"Unsupported format: {response_format}")
+
+        # adapter.web.service.query -> execute search through query service
+        if not criteria:
+            # No filters specified, get all movies
+            movies = query_service.get_all_movies()
+        else:
+            # Filters specified, use search
+            movies = query_service.search_movies(**criteria)
+
+        # adapter.web.serialization.movies -> convert movies to JSON-serializable format
+        return jsonify([_movie_to_dict(movie) for movie in movies])
 
     @app.route('/movies', methods=['POST'])
     def create_movie():
@@ -116,38 +314,32 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Post_Movie -> create new movie via API
         """
-        try:
-            # adapter.web.request.json_body -> extract JSON payload
-            data = request.get_json()
-
-            if not data:
-                return jsonify({'error': 'JSON payload required'}), 400
-
-            # adapter.web.validation.required_fields -> check required parameters
-            required_fields = ['title', 'year', 'description']
-            for field in required_fields:
-                if field not in data:
-                    return jsonify({'error': f'Missing required field: {field}'}), 400
-
-            # adapter.web.service.command -> create movie through command service
-            movie = command_service.add_movie(
-                title=data['title'],
-                year=data['year'],
-                description=data['description'],
-                rating=data.get('rating'),
-                tags=data.get('tags')
-            )
-
-            # adapter.web.response.created -> return created movie with 201 status
-            return jsonify(_movie_to_dict(movie)), 201
-
-        except (InvalidTitleError, InvalidYearError, InvalidRatingError) as e:
-            # adapter.web.error.domain_validation -> handle domain validation errors
-            return jsonify({'error': str(e)}), 400
-
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.request.empty_body -> reject a declared-empty body without invoking the parser
+        if request.content_length == 0:
+            return _static_error(_ERROR_JSON_PAYLOAD_REQUIRED, 400)
+
+        # adapter.web.request.json_body -> extract JSON payload (malformed body reads as missing)
+        data = request.get_json(silent=True)
+
+        if not data or not isinstance(data, dict):
+            return _static_error(_ERROR_JSON_PAYLOAD_REQUIRED, 400)
+
+        # adapter.web.validation.required_fields -> one set comparison on the success path
+        if not data.keys() >= _REQUIRED_MOVIE_FIELD_SET:
+            field = next(field for field in _REQUIRED_MOVIE_FIELDS if field not in data)
+            return jsonify({'error': f'Missing required field: {field}'}), 400
+
+        # adapter.web.service.command -> create movie through command service
+        movie = command_service.add_movie(
+            title=data['title'],
+            year=data['year'],
+            description=data['description'],
+            rating=data.get('rating'),
+            tags=data.get('tags')
+        )
+
+        # adapter.web.response.created -> return created movie with 201 status
+        return jsonify(_movie_to_dict(movie)), 201
 
     @app.route('/movies/<movie_id>', methods=['GET'])
     def get_movie_by_id(movie_id: str):
@@ -162,20 +354,15 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Get_Movie_By_Id -> retrieve single movie by identifier
         """
-        try:
-            # adapter.web.service.query -> find movie through query service
-            movie = query_service.get_movie_by_id(movie_id)
-
-            if movie is None:
-                # adapter.web.response.not_found -> return 404 for missing movie
-                return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
+        # adapter.web.service.query -> find movie through query service
+        movie = query_service.get_movie_by_id(movie_id)
 
-            # adapter.web.response.movie -> return movie data
-            return jsonify(_movie_to_dict(movie))
+        if movie is None:
+            # adapter.web.response.not_found -> return 404 for missing movie
+            return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
 
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.response.movie -> return movie data
+        return jsonify(_movie_to_dict(movie))
 
     @app.route('/movies/<movie_id>/rating', methods=['PUT'])
     def update_movie_rating(movie_id: str):
@@ -193,30 +380,21 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Put_Rating -> update movie rating via API
         """
-        try:
-            # adapter.web.request.json_body -> extract rating update payload
-            data = request.get_json()
+        # adapter.web.request.json_body -> extract rating update payload (malformed body reads as missing)
+        data = request.get_json(silent=True)
 
-            if not data or 'rating' not in data:
-                return jsonify({'error': 'Rating value required'}), 400
+        if not data or 'rating' not in data:
+            return _static_error(_ERROR_RATING_REQUIRED, 400)
 
-            # adapter.web.service.command -> update rating through command service
-            success = command_service.rate_movie(movie_id, data['rating'])
+        # adapter.web.service.command -> update rating through command service
+        movie = command_service.rate_movie(movie_id, data['rating'])
 
-            if not success:
-                # adapter.web.response.not_found -> movie not found for rating update
-                return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
+        if movie is None:
+            # adapter.web.response.not_found -> movie not found for rating update
+            return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
 
-            # adapter.web.response.success -> confirm successful rating update
-            return jsonify({'message': f'Rating updated to {data["rating"]}'})
-
-        except InvalidRatingError as e:
-            # adapter.web.error.domain_validation -> handle rating validation error
-            return jsonify({'error': str(e)}), 400
-
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.response.success -> confirm successful rating update
+        return jsonify({'message': f'Rating updated to {data["rating"]}'})
 
     @app.route('/movies/<movie_id>/tags', methods=['POST'])
     def add_movie_tag(movie_id: str):
@@ -234,26 +412,21 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Post_Tag -> add tag to movie via API
         """
-        try:
-            # adapter.web.request.json_body -> extract tag payload
-            data = request.get_json()
-
-            if not data or 'tag' not in data:
-                return jsonify({'error': 'Tag value required'}), 400
+        # adapter.web.request.json_body -> extract tag payload (malformed body reads as missing)
+        data = request.get_json(silent=True)
 
-            # adapter.web.service.command -> add tag through command service
-            success = command_service.add_tag_to_movie(movie_id, data['tag'])
+        if not data or 'tag' not in data:
+            return _static_error(_ERROR_TAG_REQUIRED, 400)
 
-            if not success:
-                # adapter.web.response.not_found -> movie not found for tag addition
-                return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
+        # adapter.web.service.command -> add tag through command service
+        movie = command_service.add_tag_to_movie(movie_id, data['tag'])
 
-            # adapter.web.response.success -> confirm successful tag addition
-            return jsonify({'message': f'Tag "{data["tag"]}" added'})
+        if movie is None:
+            # adapter.web.response.not_found -> movie not found for tag addition
+            return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
 
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.response.success -> confirm successful tag addition
+        return jsonify({'message': f'Tag "{data["tag"]}" added'})
 
     @app.route('/movies/<movie_id>/tags/<tag>', methods=['DELETE'])
     def remove_movie_tag(movie_id: str, tag: str):
@@ -269,20 +442,15 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Delete_Tag -> remove tag from movie via API
         """
-        try:
-            # adapter.web.service.command -> remove tag through command service
-            success = command_service.remove_tag_from_movie(movie_id, tag)
+        # adapter.web.service.command -> remove tag through command service
+        movie = command_service.remove_tag_from_movie(movie_id, tag)
 
-            if not success:
-                # adapter.web.response.not_found -> movie not found for tag removal
-                return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
+        if movie is None:
+            # adapter.web.response.not_found -> movie not found for tag removal
+            return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
 
-            # adapter.web.response.success -> confirm successful tag removal
-            return jsonify({'message': f'Tag "{tag}" removed'})
-
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.response.success -> confirm successful tag removal
+        return jsonify({'message': f'Tag "{tag}" removed'})
 
     @app.route('/movies/<movie_id>', methods=['DELETE'])
     def delete_movie(movie_id: str):
@@ -297,22 +465,18 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Delete_Movie -> remove movie via API
         """
-        try:
-            # adapter.web.service.command -> delete movie through command service
-            success = command_service.delete_movie(movie_id)
-
-            if not success:
-                # adapter.web.response.not_found -> movie not found for deletion
-                return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
+        # adapter.web.service.command -> delete movie through command service
+        success = command_service.delete_movie(movie_id)
 
-            # adapter.web.response.no_content -> successful deletion with no content
-            return '', 204
+        if not success:
+            # adapter.web.response.not_found -> movie not found for deletion
+            return jsonify({'error': f'Movie with ID {movie_id} not found'}), 404
 
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.response.no_content -> successful deletion with no content
+        return '', 204
 
     @app.route('/statistics', methods=['GET'])
+    @cached_read
     def get_catalog_statistics():
         """
         Get comprehensive statistics about the movie catalog.
@@ -322,25 +486,20 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Get_Statistics -> catalog analytics via API
         """
-        try:
-            # adapter.web.service.query -> get statistics through query service
-            stats = query_service.get_catalog_statistics()
-
-            # adapter.web.serialization.statistics -> convert statistics to JSON-safe format
-            serialized_stats = {
-                'total_movies': stats['total_movies'],
-                'movies_with_ratings': stats['movies_with_ratings'],
-                'average_rating': stats['average_rating'],
-                'unique_tags': list(stats['unique_tags']),  # Convert set to list for JSON
-                'year_range': stats['year_range']
-            }
-
-            # adapter.web.response.statistics -> return statistics data
-            return jsonify(serialized_stats)
-
-        except Exception as e:
-            # adapter.web.error.internal -> handle unexpected errors
-            return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+        # adapter.web.service.query -> get statistics through query service
+        stats = query_service.get_catalog_statistics()
+
+        # adapter.web.serialization.statistics -> convert statistics to JSON-safe format
+        serialized_stats = {
+            'total_movies': stats['total_movies'],
+            'movies_with_ratings': stats['movies_with_ratings'],
+            'average_rating': stats['average_rating'],
+            'unique_tags': list(stats['unique_tags']),  # Convert set to list for JSON
+            'year_range': stats['year_range']
+        }
+
+        # adapter.web.response.statistics -> return statistics data
+        return jsonify(serialized_stats)
 
     @app.route('/', methods=['GET'])
     def index():
@@ -352,66 +511,136 @@ def create_app(repository: MovieRepository) -> Flask:
 
         Adapter.Web.Endpoint.Index -> API documentation and route discovery
         """
-        # adapter.web.documentation -> comprehensive API route listing
-        routes_info = [
-            {
-                "route": "GET /",
-                "description": "API documentation and route listing",
-                "parameters": "None",
-                "example_url": "/"
-            },
-            {
-                "route": "GET /movies",
-                "description": "Retrieve all movies with optional filtering",
-                "parameters": "title (string), year (int), min_rating (float), max_rating (float), tags (comma-separated)",
-                "example_url": "/movies?tags=sci-fi&min_rating=8.0"
-            },
-            {
-                "route": "POST /movies",
-                "description": "Create a new movie entry",
-                "parameters": "JSON body: title (required), year (required), description (required), rating (optional), tags (optional array)",
-                "example_url": "/movies"
-            },
-            {
-                "route": "GET /movies/{id}",
-                "description": "Retrieve a specific movie by its unique ID",
-                "parameters": "id (string) - Movie's unique identifier",
-                "example_url": "/movies/sample-movie-id"
-            },
-            {
-                "route": "PUT /movies/{id}/rating",
-                "description": "Update a movie's rating",
-                "parameters": "id (string), JSON body: rating (float 1.0-10.0)",
-                "example_url": "/movies/sample-movie-id/rating"
-            },
-            {
-                "route": "POST /movies/{id}/tags",
-                "description": "Add a tag to a movie",
-                "parameters": "id (string), JSON body: tag (string)",
-                "example_url": "/movies/sample-movie-id/tags"
-            },
-            {
-                "route": "DELETE /movies/{id}/tags/{tag}",
-                "description": "Remove a specific tag from a movie",
-                "parameters": "id (string), tag (string)",
-                "example_url": "/movies/sample-movie-id/tags/sci-fi"
-            },
-            {
-                "route": "DELETE /movies/{id}",
-                "description": "Delete a movie from the catalog",
-                "parameters": "id (string) - Movie's unique identifier",
-                "example_url": "/movies/sample-movie-id"
-            },
-            {
-                "route": "GET /statistics",
-                "description": "Get comprehensive catalog statistics and analytics",
-                "parameters": "None",
-                "example_url": "/statistics"
-            }
-        ]
-
-        # adapter.web.html_generation -> create interactive documentation
-        html_content = """
+        # adapter.web.response.documentation -> serve the pre-rendered documentation page
+        return Response(_INDEX_HTML_BYTES, mimetype='text/html')
+
+    # adapter.web.error_handlers -> global error handling
+    def bad_request_error(error):
+        """Handle domain validation and query parameter errors with a 400 response."""
+        return jsonify({'error': str(error)}), 400
+
+    # adapter.web.error.bad_request -> domain rule violations and bad filters; other ValueErrors stay internal
+    for error_type in (InvalidTitleError, InvalidYearError, InvalidRatingError, InvalidFilterError):
+        app.register_error_handler(error_type, bad_request_error)
+
+    @app.errorhandler(Exception)
+    def unexpected_error(error):
+        """Log unexpected route errors and answer with a sanitized JSON 500 response."""
+        # adapter.web.error.http -> HTTP errors without a code handler (400, 413, 415, ...) keep their status
+        if isinstance(error, HTTPException):
+            response = jsonify({'error': error.name})
+            response.status_code = error.code or 500
+            return response
+
+        # adapter.web.error.sanitize -> details go to the log, never to the client
+        app.logger.exception("Unhandled error while serving %s %s", request.method, request.path)
+        return _static_error(_ERROR_INTERNAL, 500)
+
+    @app.errorhandler(404)
+    def not_found_error(error):
+        """Handle 404 errors with JSON response."""
+        return _static_error(_ERROR_NOT_FOUND, 404)
+
+    @app.errorhandler(405)
+    def method_not_allowed_error(error):
+        """Handle 405 method not allowed errors."""
+        return _static_error(_ERROR_METHOD_NOT_ALLOWED, 405)
+
+    @app.errorhandler(500)
+    def internal_error(error):
+        """Handle 500 internal server errors."""
+        return _static_error(_ERROR_INTERNAL, 500)
+
+    # adapter.web.warmup -> build the route matcher and first encode now, not on the first request
+    app.url_map.update()
+    app.json.dumps({'warm': True})
+
+    return app
+
+
+# adapter.web.documentation.route_card -> markup for one endpoint on the documentation page
+_ROUTE_CARD_TEMPLATE: str = """
+    <div class="route-card">
+        <div>
+            <span class="route-method">{method}</span>
+            <span class="route-path">{path}</span>
+        </div>
+        <div class="description">{description}</div>
+        <div class="parameters">Params: {parameters}</div>
+        <a href="{example_url}" class="example-link">{example_url}</a>
+    </div>
+"""
+
+
+def _build_index_html() -> str:
+    """
+    Render the static API documentation page.
+
+    Returns:
+        Complete HTML document listing every endpoint
+
+    Adapter.Web.Documentation.Render -> one-time page assembly
+    """
+    # adapter.web.documentation -> comprehensive API route listing
+    routes_info = [
+        {
+            "route": "GET /",
+            "description": "API documentation and route listing",
+            "parameters": "None",
+            "example_url": "/"
+        },
+        {
+            "route": "GET /movies",
+            "description": "Retrieve all movies with optional filtering",
+            "parameters": "title (string), year (int), min_rating (float), max_rating (float), tags (comma-separated), format (json | ndjson)",
+            "example_url": "/movies?tags=sci-fi&min_rating=8.0"
+        },
+        {
+            "route": "POST /movies",
+            "description": "Create a new movie entry",
+            "parameters": "JSON body: title (required), year (required), description (required), rating (optional), tags (optional array)",
+            "example_url": "/movies"
+        },
+        {
+            "route": "GET /movies/{id}",
+            "description": "Retrieve a specific movie by its unique ID",
+            "parameters": "id (string) - Movie's unique identifier",
+            "example_url": "/movies/sample-movie-id"
+        },
+        {
+            "route": "PUT /movies/{id}/rating",
+            "description": "Update a movie's rating",
+            "parameters": "id (string), JSON body: rating (float 1.0-10.0)",
+            "example_url": "/movies/sample-movie-id/rating"
+        },
+        {
+            "route": "POST /movies/{id}/tags",
+            "description": "Add a tag to a movie",
+            "parameters": "id (string), JSON body: tag (string)",
+            "example_url": "/movies/sample-movie-id/tags"
+        },
+        {
+            "route": "DELETE /movies/{id}/tags/{tag}",
+            "description": "Remove a specific tag from a movie",
+            "parameters": "id (string), tag (string)",
+            "example_url": "/movies/sample-movie-id/tags/sci-fi"
+        },
+        {
+            "route": "DELETE /movies/{id}",
+            "description": "Delete a movie from the catalog",
+            "parameters": "id (string) - Movie's unique identifier",
+            "example_url": "/movies/sample-movie-id"
+        },
+        {
+            "route": "GET /statistics",
+            "description": "Get comprehensive catalog statistics and analytics",
+            "parameters": "None",
+            "example_url": "/statistics"
+        }
+    ]
+
+    # adapter.web.html_generation -> create interactive documentation
+    html_content = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -525,31 +754,26 @@ def create_app(repository: MovieRepository) -> Flask:
 └─────────────────────────────────────────────┘
         </div>
         <p>Hexagonal Architecture | REST API | Personal Movie Manager</p>
-        <div class="tech-list">[Domain-Driven] [CQRS] [Ports+Adapters] [72 Tests]</div>
+        <div class="tech-list">[Domain-Driven] [CQRS] [Ports+Adapters] [Tested Layers]</div>
     </div>
 
     <h2>Available Endpoints</h2>
     <p>Click the URLs below to test each endpoint:</p>
 """
 
-        # adapter.web.route_documentation -> generate route cards
-        for route_info in routes_info:
-            method = route_info['route'].split()[0]
-            path = route_info['route'].split(' ', 1)[1]
-
-            html_content += f"""
-    <div class="route-card">
-        <div>
-            <span class="route-method">{method}</span>
-            <span class="route-path">{path}</span>
-        </div>
-        <div class="description">{route_info['description']}</div>
-        <div class="parameters">Params: {route_info['parameters']}</div>
-        <a href="{route_info['example_url']}" class="example-link">{route_info['example_url']}</a>
-    </div>
-"""
-
-        html_content += """
+    # adapter.web.route_documentation -> render every route card and join them in one allocation
+    html_content += ''.join(
+        _ROUTE_CARD_TEMPLATE.format(
+            method=route_info['route'].split(' ', 1)[0],
+            path=route_info['route'].split(' ', 1)[1],
+            description=route_info['description'],
+            parameters=route_info['parameters'],
+            example_url=route_info['example_url'],
+        )
+        for route_info in routes_info
+    )
+
+    html_content += """
     <div class="footer">
         <h3>Architecture</h3>
         <p>Demonstrates Hexagonal Architecture (Ports & Adapters) with:</p>
@@ -558,32 +782,18 @@ Application     → Command/Query services (CQRS)
 Ports          → Repository abstraction interfaces
 Adapters       → Web API + CLI (same business logic)
 Dependencies   → Core depends on abstractions only</pre>
-        <p>72 comprehensive tests | CLI + Web API | Docker ready</p>
+        <p>Tests for every layer | CLI + Web API | Docker ready</p>
     </div>
 </body>
 </html>
 """
 
-        # adapter.web.response.documentation -> return interactive HTML documentation
-        return html_content
+    # adapter.web.documentation.result -> finished page
+    return html_content
 
-    # adapter.web.error_handlers -> global error handling
-    @app.errorhandler(404)
-    def not_found_error(error):
-        """Handle 404 errors with JSON response."""
-        return jsonify({'error': 'Resource not found'}), 404
 
-    @app.errorhandler(405)
-    def method_not_allowed_error(error):
-        """Handle 405 method not allowed errors."""
-        return jsonify({'error': 'Method not allowed'}), 405
-
-    @app.errorhandler(500)
-    def internal_error(error):
-        """Handle 500 internal server errors."""
-        return jsonify({'error': 'Internal server error'}), 500
-
-    return app
+# adapter.web.documentation.cache -> page is static, so render and encode it once at import
+_INDEX_HTML_BYTES: bytes = _build_index_html().encode('utf-8')
 
 
 def _movie_to_dict(movie: Movie) -> Dict[str, Any]:
@@ -598,17 +808,27 @@ def _movie_to_dict(movie: Movie) -> Dict[str, Any]:
 
     Adapter.Web.Serialization.Movie -> convert domain entity to web format
     """
+    # adapter.web.serialization.entity_record -> one call fetches every field
+    movie_id, title, year, description, rating, tags = movie.to_record()
+
     # adapter.web.serialization.entity_to_dict -> map domain entity to dictionary
+    # adapter.web.serialization.tags -> immutable tuple view, encoded as a JSON array without copying
     return {
-        'id': movie.id,
-        'title': movie.title,
-        'year': movie.year,
-        'description': movie.description,
-        'rating': movie.rating,
-        'tags': movie.tags
+        'id': movie_id,
+        'title': title,
+        'year': year,
+        'description': description,
+        'rating': rating,
+        'tags': tags
     }
 
 
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    """Werkzeug request handler that keeps HTTP/1.1 connections open between requests."""
+
+    protocol_version = "HTTP/1.1"
+
+
 def main():
     """
     Main entry point for running the Flask web application.
@@ -621,8 +841,17 @@ def main():
     # adapter.web.main.app -> create Flask application
     app = create_app(repository)
 
-    # adapter.web.main.run -> start development server
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # adapter.web.main.debug -> opt in with FLASK_DEBUG=1; debug disables concurrency and adds reloader overhead
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+    # adapter.web.main.run -> threaded server with HTTP/1.1 keep-alive connections
+    app.run(
+        host='0.0.0.0',
+        port=5000,
+        debug=debug,
+        threaded=True,
+        request_handler=_KeepAliveRequestHandler,
+    )
 
 
 if __name__ == "__main__":
@@ -250,8 +250,7 @@ class TestInMemoryMovieRepository:
         # adapter.filter.year_verification -> correct movies returned
         assert len(movies_2021) == 2
         # adapter.filter.year_content -> both 2021 movies found
-        for movie in movies_2021:
-            assert movie.year == 2021
+        assert {movie.year for movie in movies_2021} == {2021}
 
     def test_repository_find_by_rating_range_filter(self):
         """
@@ -370,4 +369,494 @@ class TestInMemoryMovieRepository:
 
         # adapter.filter.no_matches_verification -> empty list returned
         assert len(no_matches) == 0
-        assert no_matches == []
\ No newline at end of file
+        assert no_matches == []
+
+    def test_repository_title_filter_tracks_saves_and_deletes(self):
+        """
+        Test title filtering stays correct as movies are added and removed.
+
+        Adapter.InMemory.Filter_Title_Index -> trigram index maintenance
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> titles sharing and not sharing trigrams
+        movie1 = Movie("The Matrix", 1999, "Sci-fi classic")
+        movie2 = Movie("Matrix Reloaded", 2003, "Sequel")
+        movie3 = Movie("Up", 2009, "Balloon house")
+
+        # adapter.repository.setup -> store test movies
+        repository = InMemoryMovieRepository()
+        repository.save(movie1)
+        repository.save(movie2)
+        repository.save(movie3)
+
+        # adapter.filter.title.short_query -> queries under three characters still match
+        assert [movie.title for movie in repository.find_by_filters(title="up")] == ["Up"]
+
+        # adapter.filter.title.case_insensitive -> indexed lookup ignores case
+        titles = [movie.title for movie in repository.find_by_filters(title="MATRIX")]
+        assert titles == ["The Matrix", "Matrix Reloaded"]
+
+        # adapter.filter.title.after_delete -> removed movies leave the index
+        repository.delete(movie1.id)
+        titles = [movie.title for movie in repository.find_by_filters(title="matrix")]
+        assert titles == ["Matrix Reloaded"]
+
+        # adapter.filter.title.after_resave -> re-saved movies are found again
+        repository.save(movie1)
+        titles = {movie.title for movie in repository.find_by_filters(title="matrix")}
+        assert titles == {"The Matrix", "Matrix Reloaded"}
+
+        # adapter.filter.title.case_folding -> Unicode case variants match each other
+        movie4 = Movie("Die Straße", 1923, "Silent film")
+        repository.save(movie4)
+        assert repository.find_by_filters(title="STRASSE") == [movie4]
+
+    def test_repository_indexed_filters_follow_entity_updates(self):
+        """
+        Test year, rating, and tag filters reflect re-saved and deleted movies.
+
+        Adapter.InMemory.Filter_Secondary_Indexes -> index maintenance on update
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> movies spread across indexed attributes
+        movie1 = Movie("Alien", 1979, "Space horror", rating=8.5, tags=["sci-fi", "horror"])
+        movie2 = Movie("Heat", 1995, "Crime epic", rating=8.3, tags=["crime"])
+        movie3 = Movie("Unrated", 1979, "No rating yet")
+
+        # adapter.repository.setup -> store test movies
+        repository = InMemoryMovieRepository()
+        repository.save(movie1)
+        repository.save(movie2)
+        repository.save(movie3)
+
+        # adapter.filter.indexed.initial -> each index answers its own criterion
+        assert repository.find_by_filters(year=1979) == [movie1, movie3]
+        assert repository.find_by_filters(rating_min=8.4) == [movie1]
+        assert repository.find_by_filters(rating_max=8.4) == [movie2]
+        assert repository.find_by_filters(tags=["horror"]) == [movie1]
+
+        # adapter.filter.indexed.mutation -> in-place updates applied through save
+        movie1.rate(7.0)
+        movie1.remove_tag("horror")
+        movie3.rate(9.0)
+        movie3.add_tag("horror")
+        repository.save(movie1)
+        repository.save(movie3)
+
+        # adapter.filter.indexed.after_update -> indexes track the new values
+        assert repository.find_by_filters(rating_min=8.4) == [movie3]
+        assert repository.find_by_filters(rating_min=6.0, rating_max=8.4) == [movie1, movie2]
+        assert repository.find_by_filters(tags=["horror"]) == [movie3]
+        assert repository.find_by_filters(year=1979, tags=["sci-fi"]) == [movie1]
+
+        # adapter.filter.indexed.after_delete -> deleted movies leave every index
+        repository.delete(movie1.id)
+        assert repository.find_by_filters(year=1979) == [movie3]
+        assert repository.find_by_filters(tags=["sci-fi"]) == []
+        assert repository.find_by_filters(rating_max=8.0) == []
+
+    def test_repository_repeated_filters_reflect_mutations(self):
+        """
+        Test cached filter results are discarded when storage changes.
+
+        Adapter.InMemory.Filter_Query_Cache -> cache invalidation on mutation
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> movies for a repeated tag query
+        movie1 = Movie("Alien", 1979, "Space horror", tags=["sci-fi", "horror"])
+        movie2 = Movie("Aliens", 1986, "Space war", tags=["horror", "sci-fi"])
+
+        # adapter.repository.setup -> start with a single movie
+        repository = InMemoryMovieRepository()
+        repository.save(movie1)
+
+        # adapter.filter.cache.equivalent_queries -> tag order does not change results
+        assert repository.find_by_filters(tags=["sci-fi", "horror"]) == [movie1]
+        assert repository.find_by_filters(tags=["horror", "sci-fi"]) == [movie1]
+
+        # adapter.filter.cache.after_save -> new movie visible to repeated query
+        repository.save(movie2)
+        assert repository.find_by_filters(tags=["horror", "sci-fi"]) == [movie1, movie2]
+
+        # adapter.filter.cache.after_delete -> removed movie gone from repeated query
+        repository.delete(movie1.id)
+        assert repository.find_by_filters(tags=["horror", "sci-fi"]) == [movie2]
+
+        # adapter.filter.cache.result_isolation -> callers cannot corrupt cached results
+        repository.find_by_filters(tags=["horror"]).clear()
+        assert repository.find_by_filters(tags=["horror"]) == [movie2]
+
+    def test_repository_narrowing_title_search(self):
+        """
+        Test successively longer title searches narrow results correctly.
+
+        Adapter.InMemory.Filter_Title_Refinement -> incremental title search
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> titles sharing a common prefix
+        movie1 = Movie("Test Pilot", 1938, "Aviation drama")
+        movie2 = Movie("Test Strip", 2020, "Documentary")
+        movie3 = Movie("Contest", 2013, "Competition")
+
+        # adapter.repository.setup -> store test movies
+        repository = InMemoryMovieRepository()
+        repository.save(movie1)
+        repository.save(movie2)
+        repository.save(movie3)
+
+        # adapter.filter.title.narrowing -> each keystroke keeps only true matches
+        assert repository.find_by_filters(title="tes") == [movie1, movie2, movie3]
+        assert repository.find_by_filters(title="test") == [movie1, movie2, movie3]
+        assert repository.find_by_filters(title="test s") == [movie2]
+
+        # adapter.filter.title.other_criteria -> refinement respects changed criteria
+        assert repository.find_by_filters(title="test", year=1938) == [movie1]
+        assert repository.find_by_filters(title="test p", year=2020) == []
+
+        # adapter.filter.title.after_save -> refinement ignores results from older data
+        repository.find_by_filters(title="test")
+        movie4 = Movie("Test Site", 1995, "Desert")
+        repository.save(movie4)
+        assert repository.find_by_filters(title="test si") == [movie4]
+
+    def test_repository_statistics_follow_saves_and_deletes(self):
+        """
+        Test maintained aggregate figures match the stored collection.
+
+        Adapter.InMemory.Statistics -> incremental aggregate maintenance
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> movies covering rated and unrated cases
+        movie1 = Movie("Alien", 1979, "Space horror", rating=8.5, tags=["sci-fi"])
+        movie2 = Movie("Heat", 1995, "Crime epic", rating=8.0, tags=["crime"])
+        movie3 = Movie("Unrated", 2010, "No rating yet")
+
+        # adapter.repository.empty_statistics -> empty catalog has no year range
+        repository = InMemoryMovieRepository()
+        assert repository.statistics() == {
+            "total_movies": 0,
+            "movies_with_ratings": 0,
+            "rating_sum": 0.0,
+            "unique_tags": set(),
+            "year_range": None
+        }
+
+        # adapter.repository.setup -> store test movies
+        repository.save(movie1)
+        repository.save(movie2)
+        repository.save(movie3)
+
+        # adapter.statistics.after_update -> re-rating replaces the previous contribution
+        movie2.rate(6.0)
+        repository.save(movie2)
+        figures = repository.statistics()
+        assert figures["total_movies"] == 3
+        assert figures["movies_with_ratings"] == 2
+        assert figures["rating_sum"] == 14.5
+        assert figures["unique_tags"] == {"sci-fi", "crime"}
+        assert figures["year_range"] == (1979, 2010)
+
+        # adapter.statistics.after_delete -> removed movies leave every aggregate
+        repository.delete(movie1.id)
+        figures = repository.statistics()
+        assert figures["movies_with_ratings"] == 1
+        assert figures["rating_sum"] == 6.0
+        assert figures["unique_tags"] == {"crime"}
+        assert figures["year_range"] == (1995, 2010)
+
+    def test_repository_save_many_matches_individual_saves(self):
+        """
+        Test batch saves leave storage and indexes as individual saves would.
+
+        Adapter.InMemory.Save_Many -> batched persistence
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> existing movie plus a batch of new ones
+        movie1 = Movie("Alien", 1979, "Space horror", rating=8.5, tags=["sci-fi"])
+        movie2 = Movie("Heat", 1995, "Crime epic", rating=8.0, tags=["crime"])
+        movie3 = Movie("Unrated", 1995, "No rating yet")
+
+        # adapter.repository.setup -> one movie saved ahead of the batch
+        repository = InMemoryMovieRepository()
+        repository.save(movie1)
+        assert repository.find_by_filters(rating_min=7.0) == [movie1]
+
+        # adapter.operation.save_many -> batch includes an update and new movies
+        movie1.rate(6.0)
+        repository.save_many([movie2, movie1, movie3])
+
+        # adapter.storage.verification.batch -> order and indexes reflect the batch
+        assert repository.count() == 3
+        assert repository.find_all() == [movie1, movie2, movie3]
+        assert repository.find_by_filters(rating_min=7.0) == [movie2]
+        assert repository.find_by_filters(rating_max=7.0) == [movie1]
+        assert repository.find_by_filters(year=1995) == [movie2, movie3]
+        assert repository.statistics()["rating_sum"] == 14.0
+
+    def test_repository_concurrent_reads_see_consistent_snapshots(self):
+        """
+        Test readers running alongside writers always see consistent results.
+
+        Adapter.InMemory.Concurrency -> copy-on-write snapshot isolation
+        """
+        import threading
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.repository.setup -> shared repository for writer and readers
+        repository = InMemoryMovieRepository()
+        errors = []
+        writing_done = threading.Event()
+
+        def write_movies():
+            # adapter.concurrency.writer -> each movie is rated and tagged on save
+            for index in range(200):
+                movie = Movie(f"Movie {index}", 2000, "Concurrent", rating=5.0, tags=["batch"])
+                repository.save(movie)
+                if index % 3 == 0:
+                    repository.delete(movie.id)
+            writing_done.set()
+
+        def read_movies():
+            # adapter.concurrency.reader -> indexes and storage agree within a snapshot
+            while not writing_done.is_set():
+                try:
+                    by_tag = repository.find_by_filters(tags=["batch"])
+                    by_rating = repository.find_by_filters(rating_min=5.0, year=2000)
+                    assert all(movie.rating == 5.0 for movie in by_rating)
+                    assert all("batch" in movie.tags for movie in by_tag)
+                except Exception as error:
+                    errors.append(error)
+                    return
+
+        # adapter.concurrency.execution -> one writer, several readers
+        threads = [threading.Thread(target=read_movies) for _ in range(3)]
+        threads.append(threading.Thread(target=write_movies))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # adapter.concurrency.verification -> no reader failed, final state complete
+        assert errors == []
+        assert repository.count() == 133
+        assert len(repository.find_by_filters(tags=["batch"])) == 133
+
+    def test_repository_iter_all_is_isolated_from_later_writes(self):
+        """
+        Test streaming iteration keeps the snapshot it started from.
+
+        Adapter.InMemory.Iter_All -> snapshot-backed streaming access
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> two stored movies
+        movie1 = Movie("First", 2001, "First movie")
+        movie2 = Movie("Second", 2002, "Second movie")
+        repository = InMemoryMovieRepository()
+        repository.save_many([movie1, movie2])
+
+        # adapter.operation.iter_all -> writes during iteration do not disturb it
+        iterator = repository.iter_all()
+        assert next(iterator) is movie1
+        repository.delete(movie2.id)
+        repository.save(Movie("Third", 2003, "Third movie"))
+        assert list(iterator) == [movie2]
+
+        # adapter.storage.verification.latest -> new iterations see the new snapshot
+        assert [movie.title for movie in repository.iter_all()] == ["First", "Third"]
+
+    def test_repository_attribute_updates_leave_published_snapshot_intact(self):
+        """
+        Test that updating one attribute does not leak into an earlier snapshot.
+
+        Adapter.InMemory.State.Copy -> containers privatized on first write
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> three well-rated movies
+        movies = [Movie(f"Movie {i}", 2000 + i, "Rated movie", rating=8.0) for i in range(3)]
+        repository = InMemoryMovieRepository()
+        repository.save_many(movies)
+
+        # adapter.operation.iter_by_filters -> rating and tag updates during iteration
+        iterator = repository.iter_by_filters(rating_min=7.0)
+        assert next(iterator) is movies[0]
+        movies[1].rate(3.0)
+        repository.save(movies[1])
+        movies[2].add_tag("late")
+        repository.save(movies[2])
+        assert list(iterator) == [movies[1], movies[2]]
+
+        # adapter.storage.verification.latest -> new queries see the updated indexes
+        assert repository.find_by_filters(rating_min=7.0) == [movies[0], movies[2]]
+        assert repository.find_by_filters(tags=["late"]) == [movies[2]]
+
+    def test_repository_find_by_ids_returns_found_movies(self):
+        """
+        Test batch lookup returns only the identifiers that exist.
+
+        Adapter.InMemory.Find_By_Ids -> batch retrieval by identity
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> two stored movies
+        movie1 = Movie("First", 2001, "First movie")
+        movie2 = Movie("Second", 2002, "Second movie")
+        repository = InMemoryMovieRepository()
+        repository.save_many([movie1, movie2])
+
+        # adapter.operation.find_by_ids -> unknown identifiers are omitted
+        found = repository.find_by_ids([movie2.id, "missing-id", movie1.id])
+        assert found == {movie2.id: movie2, movie1.id: movie1}
+
+    def test_repository_find_by_filters_paginates_matches(self):
+        """
+        Test that filtered results can be windowed with limit and offset.
+
+        Adapter.InMemory.Find_By_Filters.Pagination -> bounded result pages
+        """
+        from in_memory_repository import InMemoryMovieRepository
+        from movie_repository import InvalidFilterError
+
+        # adapter.storage.test_data -> five movies from the same year
+        repository = InMemoryMovieRepository()
+        movies = [Movie(f"Movie {index}", 2020, "Paged") for index in range(5)]
+        repository.save_many(movies)
+
+        # adapter.filter.pagination.window -> pages follow insertion order
+        assert repository.find_by_filters(year=2020, limit=2) == movies[:2]
+        assert repository.find_by_filters(year=2020, limit=2, offset=2) == movies[2:4]
+        assert repository.find_by_filters(year=2020, offset=4) == movies[4:]
+        assert repository.find_by_filters(year=2020, limit=0) == []
+
+        # adapter.filter.pagination.validation -> negative windows rejected
+        with pytest.raises(InvalidFilterError):
+            repository.find_by_filters(year=2020, limit=-1)
+        with pytest.raises(InvalidFilterError):
+            repository.find_by_filters(year=2020, offset=-1)
+
+    def test_repository_find_all_paginates(self):
+        """
+        Test that the full collection can be read one page at a time.
+
+        Adapter.InMemory.Find_All.Pagination -> bounded collection pages
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> three stored movies
+        repository = InMemoryMovieRepository()
+        movies = [Movie(f"Movie {index}", 2020, "Paged") for index in range(3)]
+        repository.save_many(movies)
+
+        # adapter.storage.retrieval.page -> windows follow insertion order
+        assert repository.find_all(limit=2) == movies[:2]
+        assert repository.find_all(limit=2, offset=2) == movies[2:]
+        assert repository.find_all(offset=3) == []
+        assert repository.find_all() == movies
+
+    def test_repository_delete_many(self):
+        """
+        Test batch deletion removes known movies and reports how many.
+
+        Adapter.InMemory.Delete_Many -> batched removal
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> three indexed movies
+        movie1 = Movie("First", 2001, "First movie", rating=7.0, tags=["drama"])
+        movie2 = Movie("Second", 2002, "Second movie", rating=8.0, tags=["action"])
+        movie3 = Movie("Third", 2003, "Third movie")
+        repository = InMemoryMovieRepository()
+        repository.save_many([movie1, movie2, movie3])
+
+        # adapter.operation.delete_many -> unknown and repeated IDs ignored
+        assert repository.delete_many([movie1.id, "missing-id", movie2.id, movie1.id]) == 2
+        assert repository.delete_many(["missing-id"]) == 0
+
+        # adapter.storage.verification.indexes -> removed movies gone from every path
+        assert repository.find_all() == [movie3]
+        assert repository.find_by_filters(tags=["action"]) == []
+        assert repository.find_by_filters(rating_min=1.0) == []
+        assert repository.statistics()["unique_tags"] == frozenset()
+
+    def test_repository_iter_by_filters_is_lazy(self):
+        """
+        Test that filtered iteration yields the same matches incrementally.
+
+        Adapter.InMemory.Iter_By_Filters -> streaming filtered search
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> mixed catalog
+        repository = InMemoryMovieRepository()
+        movies = [
+            Movie("Alien", 1979, "Space horror", tags=["horror"]),
+            Movie("Aliens", 1986, "Space action", tags=["action", "horror"]),
+            Movie("Heat", 1995, "Crime drama", tags=["crime"])
+        ]
+        repository.save_many(movies)
+
+        # adapter.filter.lazy.first_match -> consumer can stop after one result
+        iterator = repository.iter_by_filters(tags=["horror"])
+        assert next(iterator) is movies[0]
+
+        # adapter.filter.lazy.equivalence -> same results as the eager form, cached or not
+        assert list(repository.iter_by_filters(title="alien")) == movies[:2]
+        assert repository.find_by_filters(title="alien") == movies[:2]
+        assert list(repository.iter_by_filters(title="alien")) == movies[:2]
+        assert list(repository.iter_by_filters()) == movies
+
+    def test_repository_count_by_filters(self):
+        """
+        Test that filtered counts match the filtered results.
+
+        Adapter.InMemory.Count_By_Filters -> filtered count without entities
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> mixed catalog
+        repository = InMemoryMovieRepository()
+        repository.save_many([
+            Movie("Alien", 1979, "Space horror", rating=8.5, tags=["horror"]),
+            Movie("Aliens", 1986, "Space action", rating=8.4, tags=["action", "horror"]),
+            Movie("Heat", 1995, "Crime drama", tags=["crime"])
+        ])
+
+        # adapter.filter.count -> counts agree with materialized results
+        assert repository.count_by_filters() == 3
+        assert repository.count_by_filters(tags=["horror"]) == 2
+        assert repository.count_by_filters(title="alien", rating_min=8.45) == 1
+        assert repository.count_by_filters(year=2000) == 0
+        assert repository.count_by_filters(tags=["horror"]) == len(repository.find_by_filters(tags=["horror"]))
+
+    def test_repository_version_changes_with_every_write(self):
+        """
+        Test that the version token moves on writes and stays put otherwise.
+
+        Adapter.InMemory.Version -> snapshot change token
+        """
+        from in_memory_repository import InMemoryMovieRepository
+
+        # adapter.storage.test_data -> one stored movie
+        movie = Movie("Heat", 1995, "Crime drama")
+        repository = InMemoryMovieRepository()
+        initial = repository.version()
+
+        # adapter.storage.version.writes -> saves and deletes publish new versions
+        repository.save(movie)
+        saved = repository.version()
+        assert saved != initial
+        assert repository.delete(movie.id) is True
+        assert repository.version() != saved
+
+        # adapter.storage.version.noop -> reads and missed deletes leave it unchanged
+        deleted = repository.version()
+        repository.find_all()
+        assert repository.delete(movie.id) is False
+        assert repository.version() == deleted
@@ -0,0 +1,39 @@
+"""
+Test suite for the command-line interface adapter.
+
+This module tests the CLI primary adapter that translates command-line
+arguments into application service calls and renders their results as
+human-readable text.
+"""
+
+from movie_domain import Movie
+
+
+class TestMovieCLI:
+    """Test cases for the MovieCLI adapter."""
+
+    def test_list_renders_int_and_float_ratings_separately(self, capsys):
+        """
+        Test that memoized summaries distinguish equal int and float ratings.
+
+        CLI.Output.Summary_Format -> typed cache keys for displayed values
+        """
+        from movie_cli import MovieCLI
+        from in_memory_repository import InMemoryMovieRepository
+
+        # cli.test.data -> one movie, first rated with a float
+        movie = Movie("Typed Rating", 2000, "Same fields, different rating type")
+        movie.rate(9.0)
+        repository = InMemoryMovieRepository()
+        repository.save(movie)
+        cli = MovieCLI(repository)
+
+        # cli.output.float_rating -> float rating rendered as stored
+        cli.run(["list"])
+        assert "Typed Rating (2000) - 9.0/10" in capsys.readouterr().out
+
+        # cli.output.int_rating -> equal int rating is not served from the float entry
+        movie.rate(9)
+        repository.save(movie)
+        cli.run(["list"])
+        assert "Typed Rating (2000) - 9/10" in capsys.readouterr().out
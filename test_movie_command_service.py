@@ -123,6 +123,58 @@ class TestMovieCommandService:
         # application.service.verification.no_persistence -> invalid movies not saved
         mock_repository.save.assert_not_called()
 
+    def test_add_movies_persists_batch_in_one_call(self):
+        """
+        Test adding several movies issues a single batch save.
+
+        Application.Service.Command.Add_Movies -> create and persist movie batch
+        """
+        from movie_command_service import MovieCommandService
+
+        # application.service.mock.repository -> mock storage dependency
+        mock_repository = Mock(spec=MovieRepository)
+
+        # application.service.instance -> create command service
+        service = MovieCommandService(mock_repository)
+
+        # application.service.command.add_batch -> execute batch creation
+        movies = service.add_movies([
+            {"title": "First Movie", "year": 2021, "description": "First"},
+            {"title": "Second Movie", "year": 2022, "description": "Second", "rating": 7.0, "tags": ["drama"]}
+        ])
+
+        # application.service.verification.batch_entities -> entities created in input order
+        assert [movie.title for movie in movies] == ["First Movie", "Second Movie"]
+        assert movies[1].rating == 7.0
+
+        # application.service.verification.batch_persistence -> one repository round-trip
+        mock_repository.save_many.assert_called_once_with(movies)
+        mock_repository.save.assert_not_called()
+
+    def test_add_movies_with_invalid_item_saves_nothing(self):
+        """
+        Test an invalid item rejects the whole batch before persistence.
+
+        Application.Service.Command.Add_Movies_Validation -> all-or-nothing batch
+        """
+        from movie_command_service import MovieCommandService
+
+        # application.service.mock.repository -> mock storage dependency
+        mock_repository = Mock(spec=MovieRepository)
+
+        # application.service.instance -> create command service
+        service = MovieCommandService(mock_repository)
+
+        # application.service.validation.batch -> domain exception from any item
+        with pytest.raises(InvalidRatingError):
+            service.add_movies([
+                {"title": "Valid Movie", "year": 2021, "description": "Fine"},
+                {"title": "Invalid Movie", "year": 2022, "description": "Bad", "rating": 15.0}
+            ])
+
+        # application.service.verification.no_persistence -> batch not saved
+        mock_repository.save_many.assert_not_called()
+
     def test_rate_movie_success(self):
         """
         Test successfully rating an existing movie.
@@ -144,8 +196,8 @@ class TestMovieCommandService:
         # application.service.command.rate -> execute rating operation
         result = service.rate_movie(existing_movie.id, 8.5)
 
-        # application.service.verification.rating_success -> operation successful
-        assert result is True
+        # application.service.verification.rating_success -> updated entity returned
+        assert result is existing_movie
 
         # application.service.verification.movie_rated -> movie rating updated
         assert existing_movie.rating == 8.5
@@ -172,8 +224,8 @@ class TestMovieCommandService:
         # application.service.command.rate_missing -> attempt to rate nonexistent movie
         result = service.rate_movie("nonexistent-id", 8.5)
 
-        # application.service.verification.rating_failure -> operation reports failure
-        assert result is False
+        # application.service.verification.rating_failure -> no entity returned
+        assert result is None
 
         # application.service.verification.repository_interactions -> only lookup attempted
         mock_repository.find_by_id.assert_called_once_with("nonexistent-id")
@@ -225,8 +277,8 @@ class TestMovieCommandService:
         # application.service.command.add_tag -> execute tag addition
         result = service.add_tag_to_movie(existing_movie.id, "action")
 
-        # application.service.verification.tag_success -> operation successful
-        assert result is True
+        # application.service.verification.tag_success -> updated entity returned
+        assert result is existing_movie
 
         # application.service.verification.tag_added -> movie has new tag
         assert "action" in existing_movie.tags
@@ -235,6 +287,34 @@ class TestMovieCommandService:
         mock_repository.find_by_id.assert_called_once_with(existing_movie.id)
         mock_repository.save.assert_called_once_with(existing_movie)
 
+    def test_noop_mutations_skip_persistence(self):
+        """
+        Test that unchanged ratings and tags do not trigger a save.
+
+        Application.Service.Command.Noop -> skip redundant repository writes
+        """
+        from movie_command_service import MovieCommandService
+
+        # application.service.test_data -> movie already rated and tagged
+        existing_movie = Movie("Existing Movie", 2023, "Already exists", rating=8.0, tags=["action"])
+
+        # application.service.mock.repository -> configure repository mock
+        mock_repository = Mock(spec=MovieRepository)
+        mock_repository.find_by_id.return_value = existing_movie
+
+        # application.service.instance -> create command service
+        service = MovieCommandService(mock_repository)
+
+        # application.service.command.noop -> same rating, duplicate tag, absent tag
+        assert service.rate_movie(existing_movie.id, 8.0) is existing_movie
+        assert service.add_tag_to_movie(existing_movie.id, " action ") is existing_movie
+        assert service.remove_tag_from_movie(existing_movie.id, "drama") is existing_movie
+
+        # application.service.verification.no_persistence -> nothing was saved
+        assert existing_movie.rating == 8.0
+        assert existing_movie.tags == ["action"]
+        mock_repository.save.assert_not_called()
+
     def test_remove_tag_from_movie_success(self):
         """
         Test successfully removing a tag from an existing movie.
@@ -256,8 +336,8 @@ class TestMovieCommandService:
         # application.service.command.remove_tag -> execute tag removal
         result = service.remove_tag_from_movie(existing_movie.id, "action")
 
-        # application.service.verification.tag_removal_success -> operation successful
-        assert result is True
+        # application.service.verification.tag_removal_success -> updated entity returned
+        assert result is existing_movie
 
         # application.service.verification.tag_removed -> tag no longer present
         assert "action" not in existing_movie.tags
@@ -267,6 +347,71 @@ class TestMovieCommandService:
         mock_repository.find_by_id.assert_called_once_with(existing_movie.id)
         mock_repository.save.assert_called_once_with(existing_movie)
 
+    def test_add_tags_to_movies_batches_retrieval_and_persistence(self):
+        """
+        Test batch tagging fetches once and saves only changed movies.
+
+        Application.Service.Command.Add_Tags -> batch categorization through service
+        """
+        from movie_command_service import MovieCommandService
+
+        # application.service.test_data -> one movie already carries its tag
+        tagged_movie = Movie("Tagged Movie", 2023, "Has tags", tags=["action"])
+        plain_movie = Movie("Plain Movie", 2023, "No tags")
+
+        # application.service.mock.repository -> configure batch lookup
+        mock_repository = Mock(spec=MovieRepository)
+        mock_repository.find_by_ids.return_value = {
+            tagged_movie.id: tagged_movie,
+            plain_movie.id: plain_movie
+        }
+
+        # application.service.instance -> create command service
+        service = MovieCommandService(mock_repository)
+
+        # application.service.command.add_tags -> mix of no-op, real, and missing updates
+        result = service.add_tags_to_movies([
+            (tagged_movie.id, "action"),
+            (plain_movie.id, "drama"),
+            (plain_movie.id, "comedy"),
+            ("missing-id", "horror")
+        ])
+
+        # application.service.verification.tags_added -> found entities updated and returned
+        assert result == {tagged_movie.id: tagged_movie, plain_movie.id: plain_movie}
+        assert plain_movie.tags == ["drama", "comedy"]
+
+        # application.service.verification.repository_interactions -> one fetch, one save
+        mock_repository.find_by_ids.assert_called_once()
+        assert list(mock_repository.find_by_ids.call_args[0][0]) == [tagged_movie.id, plain_movie.id, "missing-id"]
+        mock_repository.save_many.assert_called_once_with([plain_movie])
+        mock_repository.find_by_id.assert_not_called()
+
+    def test_remove_tags_from_movies_skips_unchanged_batch(self):
+        """
+        Test batch untagging performs no save when nothing changes.
+
+        Application.Service.Command.Remove_Tags -> batch uncategorization through service
+        """
+        from movie_command_service import MovieCommandService
+
+        # application.service.test_data -> movie without the tag being removed
+        existing_movie = Movie("Existing Movie", 2023, "Already exists", tags=["drama"])
+
+        # application.service.mock.repository -> configure batch lookup
+        mock_repository = Mock(spec=MovieRepository)
+        mock_repository.find_by_ids.return_value = {existing_movie.id: existing_movie}
+
+        # application.service.instance -> create command service
+        service = MovieCommandService(mock_repository)
+
+        # application.service.command.remove_tags -> removal of an absent tag
+        service.remove_tags_from_movies([(existing_movie.id, "action")])
+
+        # application.service.verification.no_persistence -> unchanged movies not saved
+        assert existing_movie.tags == ["drama"]
+        mock_repository.save_many.assert_not_called()
+
     def test_delete_movie_success(self):
         """
         Test successfully deleting an existing movie.
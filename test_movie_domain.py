@@ -141,6 +141,10 @@ class TestMovieEntity:
         assert movie1.id is not None
         assert movie2.id is not None
 
+        # domain.identity.uniqueness.batch -> no collisions across several id pool refills
+        batch_ids = [Movie(f"Batch Movie {index}", 2000, "Generated").id for index in range(1000)]
+        assert len(set(batch_ids)) == len(batch_ids)
+
     def test_movie_update_rating(self):
         """
         Test that movie rating can be updated after creation.
@@ -205,4 +209,97 @@ class TestMovieEntity:
 
         # domain.movie.behavior.remove_nonexistent_tag -> removing missing tag is safe
         movie.remove_tag("horror")  # domain.operation.safe_removal -> no error
-        assert set(movie.tags) == {"action", "romance"}
\ No newline at end of file
+        assert set(movie.tags) == {"action", "romance"}
+
+        # domain.movie.query.has_tag -> membership check reflects removals
+        assert movie.has_tag("action")
+        assert not movie.has_tag("comedy")
+
+    def test_movie_tags_keep_order_without_duplicates(self):
+        """
+        Test that tags stay unique and in insertion order.
+
+        Domain.Movie.Classification.Tags_Order -> ordered unique categorization
+        """
+        from movie_domain import Movie
+
+        # domain.movie.entity.tags.normalized -> constructor strips and dedups tags
+        movie = Movie("Ordered Movie", 2022, "Has tags", tags=["drama", " action ", "drama", " "])
+        assert movie.tags == ["drama", "action"]
+
+        # domain.movie.behavior.add_duplicate_tag -> re-adding keeps original position
+        movie.add_tag("comedy")
+        movie.add_tag("drama")
+        assert movie.tags == ["drama", "action", "comedy"]
+
+        # domain.movie.behavior.remove_then_add -> re-added tag moves to the end
+        movie.remove_tag("drama")
+        movie.add_tag("drama")
+        assert movie.tags == ["action", "comedy", "drama"]
+
+    def test_movie_tag_tuple_view(self):
+        """
+        Test that the tuple view tracks tag mutations without copying on read.
+
+        Domain.Movie.Classification.Tag_Tuple -> allocation-free category view
+        """
+        from movie_domain import Movie
+
+        # domain.movie.entity.tag_view.stable -> repeated reads share one tuple
+        movie = Movie("Viewed Movie", 2022, "Has tags", tags=["action"])
+        assert movie.tag_tuple == ("action",)
+        assert movie.tag_tuple is movie.tag_tuple
+
+        # domain.movie.behavior.noop_add -> unchanged tags keep the same view
+        view = movie.tag_tuple
+        movie.add_tag("action")
+        assert movie.tag_tuple is view
+
+        # domain.movie.behavior.mutation -> view follows add and remove
+        movie.add_tag("drama")
+        movie.remove_tag("action")
+        assert movie.tag_tuple == ("drama",)
+
+    def test_movie_uses_fixed_attribute_layout(self):
+        """
+        Test that movies declare slots instead of carrying an instance dict.
+
+        Domain.Movie.Storage.Slots -> compact entity representation
+        """
+        from movie_domain import Movie
+
+        # domain.movie.entity.slots -> no per-instance attribute dictionary
+        movie = Movie("Compact Movie", 2022, "Lean storage")
+        assert not hasattr(movie, "__dict__")
+
+        # domain.movie.entity.slots.closed -> unknown attributes cannot be attached
+        with pytest.raises(AttributeError):
+            movie.unexpected = True
+
+    def test_movie_from_record_keeps_stored_state(self):
+        """
+        Test that stored movies are rehydrated without minting a new identity.
+
+        Domain.Movie.Rehydration -> trusted reconstruction from persistence
+        """
+        from movie_domain import Movie
+
+        # domain.movie.rehydration.record -> fields as an adapter would store them
+        original = Movie("Stored Movie", 2020, "Saved earlier", rating=7.5, tags=["drama", "action"])
+        restored = Movie.from_record(
+            original.id, original.title, original.year, original.description,
+            original.rating, original.tag_tuple
+        )
+
+        # domain.movie.rehydration.verification -> identity and state preserved
+        assert restored.id == original.id
+        assert (restored.title, restored.year, restored.description) == ("Stored Movie", 2020, "Saved earlier")
+        assert restored.rating == 7.5
+        assert restored.tags == ["drama", "action"]
+
+        # domain.movie.export.round_trip -> exported record rebuilds an equal entity
+        assert Movie.from_record(*restored.to_record()).to_record() == restored.to_record()
+
+        # domain.movie.rehydration.behavior -> restored entity stays fully usable
+        restored.add_tag("thriller")
+        assert restored.tag_tuple == ("drama", "action", "thriller")
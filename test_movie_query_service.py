@@ -337,17 +337,15 @@ class TestMovieQueryService:
         """
         from movie_query_service import MovieQueryService
 
-        # application.service.test_data -> create sample movies for statistics
-        sample_movies = [
-            Movie("Movie 1", 2020, "Description 1", rating=8.0, tags=["action"]),
-            Movie("Movie 2", 2021, "Description 2", rating=7.5, tags=["drama"]),
-            Movie("Movie 3", 2022, "Description 3", rating=9.0, tags=["action", "thriller"])
-        ]
-
-        # application.service.mock.repository -> configure repository mock
+        # application.service.mock.repository -> configure raw aggregate figures
         mock_repository = Mock(spec=MovieRepository)
-        mock_repository.find_all.return_value = sample_movies
-        mock_repository.count.return_value = len(sample_movies)
+        mock_repository.statistics.return_value = {
+            "total_movies": 3,
+            "movies_with_ratings": 3,
+            "rating_sum": 24.5,
+            "unique_tags": {"action", "drama", "thriller"},
+            "year_range": (2020, 2022)
+        }
 
         # application.service.instance -> create query service
         service = MovieQueryService(mock_repository)
@@ -360,10 +358,61 @@ class TestMovieQueryService:
         assert stats["average_rating"] == 8.17  # (8.0 + 7.5 + 9.0) / 3 = 8.17 (rounded)
         assert stats["movies_with_ratings"] == 3
         assert stats["unique_tags"] == {"action", "drama", "thriller"}
+        assert stats["year_range"] == (2020, 2022)
 
-        # application.service.verification.repository_interactions -> proper calls made
-        mock_repository.find_all.assert_called_once()
-        mock_repository.count.assert_called_once()
+        # application.service.verification.repository_interactions -> aggregates without full scan
+        mock_repository.statistics.assert_called_once()
+        mock_repository.find_all.assert_not_called()
+
+    def test_get_movie_by_id_memoized_within_request_scope(self):
+        """
+        Test that repeated lookups inside a request scope hit the repository once.
+
+        Application.Service.Query.Request_Scope -> request-bounded identity memo
+        """
+        from movie_query_service import MovieQueryService
+        from movie_command_service import MovieCommandService
+
+        # application.service.test_data -> movie returned by the repository
+        movie = Movie("Memo Movie", 2023, "Looked up twice")
+
+        # application.service.mock.repository -> configure single-movie lookup
+        mock_repository = Mock(spec=MovieRepository)
+        mock_repository.find_by_id.return_value = movie
+        mock_repository.delete.return_value = True
+
+        # application.service.instance -> query service wired to command side
+        service = MovieQueryService(mock_repository)
+        command_service = MovieCommandService(mock_repository, query_service=service)
+
+        # application.service.query.memoized -> second lookup served from memo
+        with service.request_scope():
+            assert service.get_movie_by_id(movie.id) is movie
+            assert service.get_movie_by_id(movie.id) is movie
+            assert mock_repository.find_by_id.call_count == 1
+
+            # application.service.memo.invalidation -> deletion evicts memoized movie
+            command_service.delete_movie(movie.id)
+            service.get_movie_by_id(movie.id)
+            assert mock_repository.find_by_id.call_count == 2
+
+        # application.service.query.unscoped -> no memoization outside a scope
+        service.get_movie_by_id(movie.id)
+        service.get_movie_by_id(movie.id)
+        assert mock_repository.find_by_id.call_count == 4
+
+        # application.service.memo.per_instance -> scopes of other services stay separate
+        other_repository = Mock(spec=MovieRepository)
+        other_repository.find_by_id.return_value = movie
+        other_service = MovieQueryService(other_repository)
+        with service.request_scope():
+            with other_service.request_scope():
+                other_service.get_movie_by_id(movie.id)
+                other_service.get_movie_by_id(movie.id)
+            service.get_movie_by_id(movie.id)
+            service.get_movie_by_id(movie.id)
+        assert other_repository.find_by_id.call_count == 1
+        assert mock_repository.find_by_id.call_count == 5
 
     def test_query_service_repository_error_handling(self):
         """
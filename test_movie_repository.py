@@ -8,8 +8,6 @@ not concrete storage implementation.
 """
 
 import pytest
-from typing import List, Optional, Dict, Any
-from abc import ABC, abstractmethod
 
 # Test will drive the creation of our repository port interface
 
@@ -148,6 +146,36 @@ class TestMovieRepositoryInterface:
         # domain.interface.method.abstract_check -> method must be abstract
         assert getattr(count_method, '__isabstractmethod__', False)
 
+    def test_repository_default_statistics_aggregates_collection(self):
+        """
+        Test that the port's default statistics walk the stored collection.
+
+        Domain.Port.Repository.Statistics -> default aggregate computation
+        """
+        from movie_repository import MovieRepository
+        from movie_domain import Movie
+        from unittest.mock import Mock
+
+        # domain.port.repository.mock -> adapter providing only the abstract operations
+        sample_movies = [
+            Movie("Movie 1", 2020, "Description 1", rating=8.0, tags=["action"]),
+            Movie("Movie 2", 2022, "Description 2", tags=["drama", "action"])
+        ]
+        repository = Mock(spec=MovieRepository)
+        repository.iter_all.return_value = iter(sample_movies)
+
+        # domain.port.repository.statistics -> default implementation on the port
+        figures = MovieRepository.statistics(repository)
+
+        # domain.port.verification.figures -> raw aggregates computed from entities
+        assert figures == {
+            "total_movies": 2,
+            "movies_with_ratings": 1,
+            "rating_sum": 8.0,
+            "unique_tags": {"action", "drama"},
+            "year_range": (2020, 2022)
+        }
+
 
 class TestMovieFilters:
     """Test cases for the MovieFilters value object."""
@@ -261,4 +289,31 @@ class TestMovieFilters:
         # domain.filters.validation.valid_range -> acceptable rating ranges
         valid_filters = MovieFilters(rating_min=1.0, rating_max=10.0)
         assert valid_filters.rating_min == 1.0
-        assert valid_filters.rating_max == 10.0
\ No newline at end of file
+        assert valid_filters.rating_max == 10.0
+
+    def test_movie_filters_value_equality(self):
+        """
+        Test that equivalent filters compare equal and hash alike.
+
+        Domain.ValueObject.MovieFilters.Equality -> hashable search criteria
+        """
+        from movie_repository import MovieFilters
+
+        # domain.filters.equality.tag_order -> tag order does not change meaning
+        first = MovieFilters(title="Matrix", rating_min=7.0, tags=["action", "sci-fi"])
+        second = MovieFilters(title=" Matrix ", rating_min=7.0, tags=["sci-fi", "action"])
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first: "cached"}[second] == "cached"
+
+        # domain.filters.equality.different -> other criteria distinguish filters
+        assert first != MovieFilters(title="Matrix", rating_min=8.0, tags=["action", "sci-fi"])
+
+        # domain.filters.immutability -> criteria cannot be reassigned
+        with pytest.raises(AttributeError):
+            first.year = 1999
+        with pytest.raises(AttributeError):
+            first._tags = ()
+        with pytest.raises(AttributeError):
+            del first._title
+        assert first == second
@@ -342,16 +342,15 @@ class TestMovieWebAdapter:
         """
         from movie_web_adapter import create_app
 
-        # adapter.web.test_data -> create sample movies for statistics
-        sample_movies = [
-            Movie("Movie 1", 2020, "Description 1", rating=8.0, tags=["action"]),
-            Movie("Movie 2", 2021, "Description 2", rating=7.5, tags=["drama"]),
-        ]
-
-        # adapter.web.mock.repository -> configure repository mock
+        # adapter.web.mock.repository -> configure raw aggregate figures
         mock_repository = Mock(spec=MovieRepository)
-        mock_repository.find_all.return_value = sample_movies
-        mock_repository.count.return_value = len(sample_movies)
+        mock_repository.statistics.return_value = {
+            "total_movies": 2,
+            "movies_with_ratings": 2,
+            "rating_sum": 15.5,
+            "unique_tags": {"action", "drama"},
+            "year_range": (2020, 2021)
+        }
 
         # adapter.web.test.setup -> create test client
         app = create_app(mock_repository)
@@ -433,4 +432,195 @@ class TestMovieWebAdapter:
         # 7. Verify deletion
         final_list_response = client.get('/movies')
         final_movies = json.loads(final_list_response.data)
-        assert len(final_movies) == 0
\ No newline at end of file
+        assert len(final_movies) == 0
+
+    def test_json_responses_use_orjson_provider(self):
+        """
+        Test that JSON responses are encoded by the orjson provider when installed.
+
+        Adapter.Web.Serialization.Orjson -> fast JSON encoding for responses
+        """
+        pytest.importorskip("orjson")
+        from movie_web_adapter import create_app, _OrjsonProvider
+
+        # adapter.web.test.setup -> app over a real repository
+        repository = InMemoryMovieRepository()
+        repository.save(Movie("Encoded Movie", 2023, "Serialized", rating=7.5, tags=["test"]))
+        app = create_app(repository)
+        client = app.test_client()
+
+        # adapter.web.serialization.provider -> orjson provider installed on the app
+        assert isinstance(app.json, _OrjsonProvider)
+
+        # adapter.web.serialization.output -> sorted keys and valid JSON body
+        response = client.get('/movies')
+        assert response.status_code == 200
+        assert response.content_type.startswith('application/json')
+        data = json.loads(response.data)
+        assert list(data[0]) == sorted(data[0])
+        assert data[0]['tags'] == ["test"]
+
+    def test_post_movie_malformed_json(self):
+        """
+        Test that a malformed JSON body is rejected as a bad request.
+
+        Adapter.Web.Endpoint.Post_Movie_Malformed -> request body parsing failure
+        """
+        from movie_web_adapter import create_app
+
+        # adapter.web.mock.repository -> repository should never be touched
+        mock_repository = Mock(spec=MovieRepository)
+
+        # adapter.web.test.setup -> create test client
+        app = create_app(mock_repository)
+        client = app.test_client()
+
+        # adapter.web.request.malformed_body -> truncated JSON document
+        response = client.post('/movies', data='{"title": "Broken', content_type='application/json')
+
+        # adapter.web.verification.bad_request -> client error, nothing saved
+        assert response.status_code == 400
+        assert 'error' in json.loads(response.data)
+        mock_repository.save.assert_not_called()
+
+    def test_read_responses_cached_until_repository_changes(self):
+        """
+        Test that repeated reads are replayed from cache until the repository version moves.
+
+        Adapter.Web.Cache.Read -> serialized GET responses reused per repository version
+        """
+        from movie_web_adapter import create_app
+
+        # adapter.web.mock.repository -> count repository reads, deletes bump the version
+        mock_repository = Mock(spec=MovieRepository)
+        mock_repository.find_all.return_value = [Movie("Cached Movie", 2023, "Read once")]
+        mock_repository.version.return_value = 1
+
+        def delete(movie_id):
+            mock_repository.version.return_value += 1
+            return True
+
+        mock_repository.delete.side_effect = delete
+
+        # adapter.web.test.setup -> create test client
+        app = create_app(mock_repository)
+        client = app.test_client()
+
+        # adapter.web.cache.hit -> identical query served without a second read
+        first = client.get('/movies')
+        second = client.get('/movies')
+        assert first.data == second.data
+        assert second.content_type.startswith('application/json')
+        mock_repository.find_all.assert_called_once()
+
+        # adapter.web.cache.invalidation -> a successful write forces a fresh read
+        assert client.delete('/movies/some-id').status_code == 204
+        client.get('/movies')
+        assert mock_repository.find_all.call_count == 2
+
+        # adapter.web.cache.external_write -> writes outside this app invalidate too
+        mock_repository.version.return_value += 1
+        client.get('/movies')
+        assert mock_repository.find_all.call_count == 3
+
+        # adapter.web.cache.unversioned -> without a version token every read is fresh
+        mock_repository.version.return_value = None
+        client.get('/movies')
+        client.get('/movies')
+        assert mock_repository.find_all.call_count == 5
+
+    def test_errors_mapped_by_global_handlers(self):
+        """
+        Test that validation and unexpected errors become JSON error responses.
+
+        Adapter.Web.Error_Handlers -> centralized exception to status mapping
+        """
+        from movie_web_adapter import create_app
+
+        # adapter.web.mock.repository -> repository fails unexpectedly on listing
+        mock_repository = Mock(spec=MovieRepository)
+        mock_repository.find_all.side_effect = RuntimeError("storage offline")
+
+        # adapter.web.test.setup -> create test client
+        app = create_app(mock_repository)
+        client = app.test_client()
+
+        # adapter.web.error.bad_request -> unparsable query value is a client error
+        response = client.get('/movies?year=unknown')
+        assert response.status_code == 400
+        assert 'error' in json.loads(response.data)
+
+        # adapter.web.error.internal -> unexpected failure reported as sanitized JSON 500
+        response = client.get('/movies')
+        assert response.status_code == 500
+        assert json.loads(response.data) == {'error': 'Internal server error'}
+        assert b'storage offline' not in response.data
+
+        # adapter.web.error.not_found -> HTTP errors keep their own handlers
+        assert client.get('/no-such-route').status_code == 404
+
+        # adapter.web.error.internal_value_error -> internal ValueErrors are not client errors
+        mock_repository.find_all.side_effect = ValueError("internal detail")
+        response = client.get('/movies')
+        assert response.status_code == 500
+        assert b'internal detail' not in response.data
+
+        # adapter.web.error.http_passthrough -> HTTP errors without a code handler keep their status
+        app.config['MAX_CONTENT_LENGTH'] = 10
+        response = client.post('/movies', data=json.dumps({"title": "Far Too Long"}), content_type='application/json')
+        assert response.status_code == 413
+        assert 'error' in json.loads(response.data)
+
+    def test_get_movies_streams_ndjson(self):
+        """
+        Test that format=ndjson streams one JSON object per line.
+
+        Adapter.Web.Endpoint.Get_Movies_Ndjson -> incremental collection response
+        """
+        from movie_web_adapter import create_app
+
+        # adapter.web.test.setup -> app over a real repository
+        repository = InMemoryMovieRepository()
+        repository.save(Movie("First Stream", 2020, "One", rating=7.0, tags=["drama"]))
+        repository.save(Movie("Second Stream", 2021, "Two", rating=9.0, tags=["drama", "epic"]))
+        app = create_app(repository)
+        client = app.test_client()
+
+        # adapter.web.response.ndjson -> every line is one encoded movie
+        response = client.get('/movies?format=ndjson')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = response.data.decode().splitlines()
+        assert [json.loads(line)['title'] for line in lines] == ["First Stream", "Second Stream"]
+
+        # adapter.web.response.ndjson_filtered -> filters apply to the stream
+        response = client.get('/movies?format=ndjson&tags=epic')
+        assert [json.loads(line)['title'] for line in response.data.decode().splitlines()] == ["Second Stream"]
+
+        # adapter.web.error.bad_request -> unknown formats are rejected
+        assert client.get('/movies?format=xml').status_code == 400
+
+    def test_post_movie_missing_required_field(self):
+        """
+        Test that the first missing required field is reported and nothing is saved.
+
+        Adapter.Web.Endpoint.Post_Movie_Missing_Field -> payload completeness check
+        """
+        from movie_web_adapter import create_app
+
+        # adapter.web.mock.repository -> repository should never be touched
+        mock_repository = Mock(spec=MovieRepository)
+
+        # adapter.web.test.setup -> create test client
+        app = create_app(mock_repository)
+        client = app.test_client()
+
+        # adapter.web.validation.required_fields -> year and description absent
+        response = client.post('/movies', data=json.dumps({"title": "Partial"}), content_type='application/json')
+        assert response.status_code == 400
+        assert json.loads(response.data) == {'error': 'Missing required field: year'}
+
+        # adapter.web.request.empty_body -> zero-length body rejected before parsing
+        response = client.post('/movies', data=b'', content_type='application/json')
+        assert response.status_code == 400
+        mock_repository.save.assert_not_called()